@@ -0,0 +1,284 @@
+"""Minimal GitHub REST/GraphQL client over persistent keep-alive HTTPS connections.
+
+`gh` is only spawned as a fallback, at most once each: for the repository slug when
+GH_REPO is unset and .git/config has no GitHub origin, and for the auth token when
+GH_TOKEN/GITHUB_TOKEN are unset. Every API call reuses its thread's keep-alive
+connection and goes through a shared RateLimiter so concurrent callers keep a
+steady cadence.
+"""
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any
+
+API_HOST = "api.github.com"
+PAGE_SIZE = 100
+SECONDARY_LIMIT_RETRIES = 4
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD"))
+_GITHUB_REMOTE_RE = re.compile(r"github\.com[:/]+([^/\s]+)/([^/\s]+?)(?:\.git)?/?$")
+
+
+class GitHubSetupError(RuntimeError):
+    """Raised when repository context or credentials cannot be resolved."""
+
+
+class GitHubApiError(RuntimeError):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class RateLimiter:
+    """Spaces requests at least `min_interval` apart and pauses when the primary quota runs low."""
+
+    def __init__(self, min_interval: float = 0.1, reserve: int = 100) -> None:
+        self.min_interval = min_interval
+        self.reserve = reserve
+        self.remaining: int | None = None
+        self.reset_at: float = 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self.remaining is not None and self.remaining < self.reserve:
+                delay = self.reset_at - time.time()
+                if delay > 0:
+                    time.sleep(delay + 1.0)
+                    now = time.monotonic()
+                self.remaining = None
+            if self._next_slot > now:
+                time.sleep(self._next_slot - now)
+                now = self._next_slot
+            self._next_slot = now + self.min_interval
+
+    def update(self, remaining: str | None, reset: str | None) -> None:
+        with self._lock:
+            if remaining is not None and remaining.isdigit():
+                self.remaining = int(remaining)
+            if reset is not None and reset.isdigit():
+                self.reset_at = float(reset)
+
+
+def _gh_output(args: list[str]) -> tuple[int, str]:
+    gh = shutil.which("gh")
+    if not gh:
+        return 127, "GitHub CLI (gh) not found on PATH."
+    proc = subprocess.run([gh, *args], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return proc.returncode, proc.stdout.strip()
+
+
+def _repository_from_git_config(start: Path) -> tuple[str, str] | None:
+    """Read the origin remote straight from .git/config so no git/gh process is spawned."""
+    for directory in (start, *start.parents):
+        config_path = directory / ".git" / "config"
+        if not config_path.is_file():
+            continue
+        in_origin = False
+        for raw_line in config_path.read_text(encoding="utf-8", errors="replace").splitlines():
+            line = raw_line.strip()
+            if line.startswith("["):
+                in_origin = line.replace(" ", "") == '[remote"origin"]'
+            elif in_origin and line.startswith("url"):
+                match = _GITHUB_REMOTE_RE.search(line.partition("=")[2].strip())
+                return (match.group(1), match.group(2)) if match else None
+        return None
+    return None
+
+
+def resolve_repository() -> tuple[str, str]:
+    slug = os.environ.get("GH_REPO", "").strip()
+    if not slug:
+        from_config = _repository_from_git_config(Path.cwd())
+        if from_config is not None:
+            return from_config
+        rc, output = _gh_output(["repo", "view", "--json", "owner,name"])
+        if rc != 0:
+            raise GitHubSetupError(f"No GitHub repository context available.\n{output}")
+        data = json.loads(output)
+        return str(data["owner"]["login"]), str(data["name"])
+    owner, _, name = slug.rpartition("/")
+    if not owner or not name:
+        raise GitHubSetupError(f"GH_REPO must look like 'owner/name', got: {slug}")
+    return owner.rpartition("/")[2], name
+
+
+def resolve_token() -> str:
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(var, "").strip()
+        if token:
+            return token
+    rc, output = _gh_output(["auth", "token"])
+    if rc != 0 or not output:
+        raise GitHubSetupError(f"GitHub authentication failed.\n{output}\nRun: gh auth login -h github.com")
+    return output
+
+
+class GitHubClient:
+    def __init__(self, owner: str, repo: str, token: str, host: str = API_HOST, timeout: float = 30.0) -> None:
+        self.owner = owner
+        self.repo = repo
+        self.host = host
+        self.timeout = timeout
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "agai-scripts",
+            "Content-Type": "application/json",
+        }
+        self.limiter = RateLimiter()
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPSConnection] = []
+        self._connections_lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "GitHubClient":
+        owner, repo = resolve_repository()
+        return cls(owner=owner, repo=repo, token=resolve_token())
+
+    @property
+    def repo_path(self) -> str:
+        return f"/repos/{self.owner}/{self.repo}"
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        # http.client connections are not thread-safe, so each worker thread keeps its own.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(self.host, timeout=self.timeout)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _send(self, method: str, path: str, body: bytes | None) -> tuple[http.client.HTTPResponse, bytes]:
+        for attempt in range(2):
+            reused = getattr(self._local, "conn", None) is not None
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=body, headers=self._headers)
+            except (http.client.HTTPException, OSError):
+                # The request never went out, so a stale keep-alive connection can be replaced and retried.
+                self._drop_connection()
+                if attempt or not reused:
+                    raise
+                continue
+            try:
+                response = conn.getresponse()
+                return response, response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                self._drop_connection()
+                # A POST may already have been processed (e.g. an issue created), so only idempotent
+                # requests are re-sent, and only when the server closed an idle keep-alive connection.
+                stale = isinstance(exc, (http.client.RemoteDisconnected, ConnectionResetError))
+                if attempt or not reused or not stale or method not in _IDEMPOTENT_METHODS:
+                    raise
+        raise AssertionError("unreachable")
+
+    def request(self, method: str, path: str, payload: Any = None) -> tuple[int, Any]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        for attempt in range(SECONDARY_LIMIT_RETRIES + 1):
+            self.limiter.acquire()
+            response, raw = self._send(method, path, body)
+            self.limiter.update(response.getheader("X-RateLimit-Remaining"), response.getheader("X-RateLimit-Reset"))
+            if attempt == SECONDARY_LIMIT_RETRIES or not self._is_secondary_limit(response, raw):
+                break
+            retry_after = response.getheader("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else float(2**attempt)
+            time.sleep(min(delay, 8.0) + random.uniform(0.0, 0.5))
+        try:
+            data = json.loads(raw) if raw else None
+        except json.JSONDecodeError:
+            data = {"message": raw.decode("utf-8", errors="replace")}
+        return response.status, data
+
+    @staticmethod
+    def _is_secondary_limit(response: http.client.HTTPResponse, raw: bytes) -> bool:
+        if response.status == 429:
+            return True
+        return response.status == 403 and b"secondary rate limit" in raw.lower()
+
+    def _checked(self, method: str, path: str, payload: Any = None, expect: tuple[int, ...] = (200,)) -> Any:
+        status, data = self.request(method, path, payload)
+        if status not in expect:
+            message = data.get("message", "") if isinstance(data, dict) else str(data)
+            raise GitHubApiError(status, message)
+        return data
+
+    def _paginate(self, path: str, params: dict[str, str]) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        page = 1
+        while True:
+            query = urllib.parse.urlencode({**params, "per_page": str(PAGE_SIZE), "page": str(page)})
+            data = self._checked("GET", f"{path}?{query}")
+            if not isinstance(data, list):
+                break
+            rows.extend(item for item in data if isinstance(item, dict))
+            if len(data) < PAGE_SIZE:
+                break
+            page += 1
+        return rows
+
+    def repository(self) -> dict[str, Any]:
+        return self._checked("GET", self.repo_path)
+
+    def labels_list(self) -> dict[str, str]:
+        rows = self._paginate(f"{self.repo_path}/labels", {})
+        return {str(row["name"]): str(row.get("color", "")) for row in rows if "name" in row}
+
+    def labels_create(self, name: str, color: str, description: str) -> bool:
+        status, _ = self.request(
+            "POST",
+            f"{self.repo_path}/labels",
+            {"name": name, "color": color, "description": description},
+        )
+        # 422 means the label already exists, which is what the caller wants.
+        return status in (201, 422)
+
+    def issues_list(self, state: str = "all", since: str | None = None) -> list[dict[str, Any]]:
+        params = {"state": state}
+        if since:
+            params["since"] = since
+        rows = self._paginate(f"{self.repo_path}/issues", params)
+        return [row for row in rows if "pull_request" not in row]
+
+    def issues_create(self, title: str, body: str, labels: list[str]) -> dict[str, Any]:
+        return self._checked(
+            "POST",
+            f"{self.repo_path}/issues",
+            {"title": title, "body": body, "labels": labels},
+            expect=(201,),
+        )
+
+    def graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        status, data = self.request("POST", "/graphql", {"query": query, "variables": variables})
+        if not isinstance(data, dict):
+            return {"errors": [{"message": f"HTTP {status}: unexpected graphql response"}]}
+        if status != 200 and "errors" not in data:
+            data["errors"] = [{"message": f"HTTP {status}: {data.get('message', '')}"}]
+        return data
@@ -0,0 +1,344 @@
+"""Plan-to-GitHub issue sync shared by the issue scripts in this directory."""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from _gh_http import GitHubApiError, GitHubClient, GitHubSetupError
+
+# GitHub caps GraphQL mutations per request well above this, but smaller
+# batches keep a single failure cheap and stay clear of secondary rate limits.
+CREATE_BATCH_SIZE = 20
+# Batches are independent; the client's RateLimiter keeps their cadence steady.
+CREATE_WORKERS = 10
+
+SYNC_STATE_FILE = ".agai_sync_state.json"
+PROGRESS_EVERY = 10
+
+# Labels confirmed to exist in the current process; never re-listed or re-created.
+_label_cache: set[str] = set()
+
+
+@dataclass(frozen=True)
+class PlanIssue:
+    __slots__ = ("jira_id", "phase", "title", "body", "labels")
+
+    jira_id: str
+    phase: str
+    title: str
+    body: str
+    labels: tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PlanIssue":
+        return cls(
+            jira_id=str(data["jira_id"]),
+            phase=str(data["phase"]),
+            title=str(data["title"]),
+            body=str(data["body"]),
+            labels=tuple(str(label) for label in data.get("labels", [])),
+        )
+
+
+def load_plan_issues(plan_path: Path) -> list[PlanIssue]:
+    # object_hook builds PlanIssue rows while parsing, so no intermediate issue dicts are kept.
+    data = json.loads(
+        plan_path.read_text(encoding="utf-8"),
+        object_hook=lambda obj: PlanIssue.from_dict(obj) if "jira_id" in obj else obj,
+    )
+    return [issue for issue in data.get("issues", []) if isinstance(issue, PlanIssue)]
+
+
+def issue_title(jira_id: str, phase: str, title: str) -> str:
+    return f"[{jira_id}][{phase}] {title}"
+
+
+def label_color(name: str) -> str:
+    palette = {
+        "phase-0": "0052CC",
+        "phase-1": "0E8A16",
+        "phase-2": "5319E7",
+        "phase-3": "FBCA04",
+        "phase-4": "D93F0B",
+        "phase-5": "B60205",
+        "program": "1D76DB",
+        "governance": "C2E0C6",
+        "eval": "EDEDED",
+        "market": "5319E7",
+        "core": "0E8A16",
+        "performance": "FBCA04",
+        "quantum": "0052CC",
+        "validation": "B60205",
+    }
+    return palette.get(name, "D4C5F9")
+
+
+def ensure_labels(client: GitHubClient, labels: set[str]) -> None:
+    if not labels - _label_cache:
+        return
+    _label_cache.update(client.labels_list())
+    for label in sorted(labels - _label_cache):
+        description = f"Auto-managed label: {label}"
+        if client.labels_create(label, color=label_color(label), description=description):
+            _label_cache.add(label)
+
+
+def _title_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "agai" / "gh_issues.json"
+
+
+def _load_title_cache(repo: str) -> dict[str, Any]:
+    try:
+        data = json.loads(_title_cache_path().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {"last_sync": "", "titles": {}}
+    entry = data.get(repo) if isinstance(data, dict) else None
+    if not isinstance(entry, dict) or not isinstance(entry.get("titles"), dict):
+        return {"last_sync": "", "titles": {}}
+    return entry
+
+
+def _save_title_cache(repo: str, entry: dict[str, Any]) -> None:
+    path = _title_cache_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    data[repo] = entry
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=True), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def sync_issue_titles(client: GitHubClient) -> dict[str, int]:
+    """Return title -> issue number, fetching only issues updated since the last cached sync."""
+    repo = f"{client.owner}/{client.repo}"
+    entry = _load_title_cache(repo)
+    titles: dict[str, int] = dict(entry["titles"])
+    last_sync = str(entry.get("last_sync", ""))
+    for row in client.issues_list(state="all", since=last_sync or None):
+        title = row.get("title")
+        if isinstance(title, str):
+            titles[title] = int(row.get("number", 0))
+        updated_at = str(row.get("updated_at", ""))
+        if updated_at > last_sync:
+            last_sync = updated_at
+    _save_title_cache(repo, {"last_sync": last_sync, "titles": titles})
+    return titles
+
+
+def repository_ids(client: GitHubClient) -> tuple[str, dict[str, str]]:
+    query = (
+        "query($owner: String!, $name: String!, $after: String) { "
+        "repository(owner: $owner, name: $name) { id labels(first: 100, after: $after) { "
+        "nodes { id name } pageInfo { hasNextPage endCursor } } } }"
+    )
+    repository_id = ""
+    label_ids: dict[str, str] = {}
+    after: str | None = None
+    while True:
+        data = client.graphql(query, {"owner": client.owner, "name": client.repo, "after": after})
+        repository = (data.get("data") or {}).get("repository") or {}
+        repository_id = repository_id or str(repository.get("id", ""))
+        labels = repository.get("labels") or {}
+        for node in labels.get("nodes") or []:
+            if isinstance(node, dict) and isinstance(node.get("name"), str):
+                label_ids[node["name"]] = str(node.get("id", ""))
+        page_info = labels.get("pageInfo") or {}
+        after = page_info.get("endCursor")
+        if not page_info.get("hasNextPage") or not after:
+            return repository_id, label_ids
+
+
+def build_create_mutation(count: int) -> str:
+    params = ", ".join(f"$i{idx}: CreateIssueInput!" for idx in range(count))
+    fields = " ".join(f"i{idx}: createIssue(input: $i{idx}) {{ issue {{ number url }} }}" for idx in range(count))
+    return f"mutation({params}) {{ {fields} }}"
+
+
+def create_issue_batch(client: GitHubClient, inputs: list[dict[str, Any]]) -> list[tuple[int, str]]:
+    """Create up to CREATE_BATCH_SIZE issues with one GraphQL request.
+
+    Returns one (issue number, url) row per input, in input order; a failed row has number 0 and the error text.
+    """
+    data = client.graphql(
+        build_create_mutation(len(inputs)),
+        {f"i{idx}": item for idx, item in enumerate(inputs)},
+    )
+    payload = data.get("data") or {}
+    errors_by_alias: dict[str, str] = {}
+    for error in data.get("errors") or []:
+        path = error.get("path") or [""]
+        errors_by_alias[str(path[0])] = str(error.get("message", "unknown error"))
+    results: list[tuple[int, str]] = []
+    for idx in range(len(inputs)):
+        alias = f"i{idx}"
+        issue = (payload.get(alias) or {}).get("issue")
+        if isinstance(issue, dict) and issue.get("url"):
+            results.append((int(issue.get("number", 0)), str(issue["url"])))
+        else:
+            results.append((0, errors_by_alias.get(alias) or errors_by_alias.get("", "issue was not created")))
+    return results
+
+
+def issue_body(issue: PlanIssue) -> str:
+    # Hidden idempotency key so a created issue can always be traced back to its plan entry.
+    return f"{issue.body}\n\n<!-- agai-jira-id: {issue.jira_id} -->"
+
+
+def _load_sync_state(path: Path, repo: str) -> dict[str, int]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    entry = data.get(repo) if isinstance(data, dict) else None
+    if not isinstance(entry, dict):
+        return {}
+    return {str(jira_id): int(number) for jira_id, number in entry.items()}
+
+
+def _save_sync_state(path: Path, repo: str, state: dict[str, int]) -> None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    data[repo] = dict(sorted(state.items()))
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Create GitHub issues for every entry in config/phases.json.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the issues that would be created and exit")
+    parser.add_argument("--resume-from", default="", help="Skip plan entries before this jira id, e.g. AGAI-200")
+    parser.add_argument(
+        "--state-file",
+        default=SYNC_STATE_FILE,
+        help="jira id -> issue number map used to resume without re-creating issues",
+    )
+    return parser
+
+
+def main(skip_existing: bool = True, argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    root = Path(__file__).resolve().parents[1]
+    plan_path = root / "config" / "phases.json"
+    if not plan_path.exists():
+        print(f"Missing plan file: {plan_path}")
+        return 1
+
+    try:
+        client = GitHubClient.from_environment()
+        client.repository()
+    except GitHubSetupError as exc:
+        print(exc)
+        print("Fallback: run this in a configured git repo after `gh auth login`, or set GH_REPO and GH_TOKEN.")
+        return 1
+    except GitHubApiError as exc:
+        print(f"Repository {client.owner}/{client.repo} is not accessible ({exc}).")
+        print("Run: gh auth login -h github.com")
+        return 1
+
+    issues = load_plan_issues(plan_path)
+    if not issues:
+        print("No issues found in phases.json.")
+        return 1
+    if args.resume_from:
+        jira_ids = [issue.jira_id for issue in issues]
+        if args.resume_from not in jira_ids:
+            print(f"Unknown --resume-from jira id: {args.resume_from}")
+            return 1
+        issues = issues[jira_ids.index(args.resume_from) :]
+
+    repo = f"{client.owner}/{client.repo}"
+    state_path = Path(args.state_file)
+    state = _load_sync_state(state_path, repo)
+    existing_titles = sync_issue_titles(client=client) if skip_existing else {}
+
+    to_create: list[PlanIssue] = []
+    planned_titles: set[str] = set()
+    skipped = 0
+    for issue in issues:
+        title = issue_title(issue.jira_id, issue.phase, issue.title)
+        if issue.jira_id in state or title in existing_titles or title in planned_titles:
+            skipped += 1
+            print(f"Skipped existing issue: {title}")
+            continue
+        planned_titles.add(title)
+        to_create.append(issue)
+
+    if args.dry_run:
+        for issue in to_create:
+            print(f"Would create: {issue_title(issue.jira_id, issue.phase, issue.title)} labels={list(issue.labels)}")
+        print(f"Dry run: {len(to_create)} to create, {skipped} skipped.")
+        return 0
+
+    all_labels: set[str] = set()
+    for issue in to_create:
+        all_labels.update(issue.labels)
+    ensure_labels(client=client, labels=all_labels)
+
+    repository_id, label_ids = repository_ids(client=client)
+    if not repository_id:
+        print("Could not resolve repository id via GraphQL.")
+        return 1
+    missing_labels = sorted(all_labels - label_ids.keys())
+    if missing_labels:
+        # Creating the issues without these labels would silently drop them.
+        print(f"Could not resolve label ids via GraphQL: {', '.join(missing_labels)}")
+        return 1
+
+    created = 0
+    processed = 0
+    next_report = PROGRESS_EVERY
+    started = time.perf_counter()
+    batches = [to_create[offset : offset + CREATE_BATCH_SIZE] for offset in range(0, len(to_create), CREATE_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=CREATE_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                create_issue_batch,
+                client,
+                [
+                    {
+                        "repositoryId": repository_id,
+                        "title": issue_title(issue.jira_id, issue.phase, issue.title),
+                        "body": issue_body(issue),
+                        "labelIds": [label_ids[label] for label in issue.labels],
+                    }
+                    for issue in batch
+                ],
+            ): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            for issue, (number, detail) in zip(futures[future], future.result()):
+                if number:
+                    created += 1
+                    state[issue.jira_id] = number
+                else:
+                    print(f"Failed to create issue: {issue_title(issue.jira_id, issue.phase, issue.title)}")
+                    print(f"ERROR: {detail}")
+            # Persist after every batch so an interrupted run resumes without re-creating issues.
+            _save_sync_state(state_path, repo, state)
+            processed += len(futures[future])
+            if processed >= next_report or processed == len(to_create):
+                eta = (time.perf_counter() - started) / processed * (len(to_create) - processed)
+                print(f"{processed}/{len(to_create)} ({100 * processed / len(to_create):.1f}%) ETA {eta:.0f}s", flush=True)
+                next_report = processed - processed % PROGRESS_EVERY + PROGRESS_EVERY
+
+    print(f"Created {created}/{len(issues)} issues. Skipped {skipped}.")
+    return 0
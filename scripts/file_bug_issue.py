@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import argparse
-import shutil
-import subprocess
 import sys
 
+from _gh_http import GitHubApiError, GitHubClient, GitHubSetupError
+from _gh_issues_lib import issue_title
+
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Create a phase-labeled bug issue via gh issue.")
+    parser = argparse.ArgumentParser(description="Create a phase-labeled bug issue via the GitHub API.")
     parser.add_argument("--jira-id", required=True, help="Example: AGAI-900")
     parser.add_argument("--phase", required=True, help="Example: Phase-2")
     parser.add_argument("--title", required=True, help="Bug title")
@@ -18,9 +19,10 @@ def main() -> int:
     parser.add_argument("--actual", required=True, help="Actual behavior")
     args = parser.parse_args()
 
-    gh = shutil.which("gh")
-    if not gh:
-        print("gh is not installed.")
+    try:
+        client = GitHubClient.from_environment()
+    except GitHubSetupError as exc:
+        print(exc)
         return 1
 
     body = (
@@ -39,11 +41,14 @@ def main() -> int:
         "- [ ] Fix implemented\n"
         "- [ ] Regression test added\n"
     )
-    title = f"[{args.jira_id}][{args.phase}] BUG: {args.title}"
-    cmd = [gh, "issue", "create", "--title", title, "--body", body, "--label", "bug"]
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    print(proc.stdout.strip())
-    return proc.returncode
+    title = issue_title(args.jira_id, args.phase, f"BUG: {args.title}")
+    try:
+        issue = client.issues_create(title=title, body=body, labels=["bug"])
+    except GitHubApiError as exc:
+        print(f"Failed to create issue: {exc}")
+        return 1
+    print(issue.get("html_url", ""))
+    return 0
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -10,16 +11,22 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from agai.runtime import AgenticRuntime
-
 
 def main() -> int:
+    # Deferred so the script starts without importing the whole runtime graph until it is needed.
+    from agai.runtime import AgenticRuntime
+
     runtime = AgenticRuntime(use_ollama=False, artifacts_dir=str(ROOT / "artifacts"))
-    market = runtime.generate_market_gap_report()
-    demo = runtime.run_quantum_research_demo(
-        "Develop a falsifiable path to improve logical error rate under strict laptop budget."
-    )
-    evaluation = runtime.run_quantum_hard_suite()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # The market report touches no agent state, so it overlaps with the agent-driven stages.
+        # The demo and hard suite share the same agent adapters and stay sequential.
+        market_future = executor.submit(runtime.generate_market_gap_report)
+        demo = runtime.run_quantum_research_demo(
+            "Develop a falsifiable path to improve logical error rate under strict laptop budget."
+        )
+        evaluation = runtime.run_quantum_hard_suite()
+        market = market_future.result()
+    # Distillation reads the trace written by every stage above, so it runs last.
     distilled = runtime.run_trace_distillation()
     summary = {
         "market_top_opportunity": market["opportunities"][0]["key"],
@@ -1,41 +1,135 @@
 from __future__ import annotations
 
+import http.client
 import json
+import threading
 import urllib.error
-import urllib.request
-from typing import Any
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Callable, Iterator
 
 from ..model_adapter import BaseModelAdapter
 
+# The offline fallback embedding only depends on the character-code sum modulo 97,
+# so all 97 possible vectors are built once.
+_FALLBACK_EMBEDDINGS = tuple(
+    tuple(float((residue * (i + 7)) % 97) / 97.0 for i in range(16)) for residue in range(97)
+)
+
 
 class OllamaAdapter(BaseModelAdapter):
-    def __init__(self, model_name: str = "llama3.2:3b", endpoint: str = "http://localhost:11434") -> None:
+    """
+    Adapter for a local Ollama server.
+    Keeps one keep-alive HTTP connection per adapter and streams generations as NDJSON.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "llama3.2:3b",
+        endpoint: str = "http://localhost:11434",
+        embed_cache_size: int = 1024,
+    ) -> None:
         super().__init__(model_name=model_name)
         self.endpoint = endpoint.rstrip("/")
+        parts = urllib.parse.urlsplit(self.endpoint)
+        self._scheme = parts.scheme or "http"
+        self._netloc = parts.netloc or parts.path
+        self._base_path = parts.path if parts.netloc else ""
+        self._conn: http.client.HTTPConnection | None = None
+        self._conn_lock = threading.Lock()
+        self._embed_cache: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._embed_cache_size = embed_cache_size
+        # Separate from _conn_lock so cache hits never wait on an in-flight request.
+        self._embed_cache_lock = threading.Lock()
 
-    def _post_json(self, path: str, payload: dict[str, Any], timeout: int = 60) -> dict[str, Any]:
+    def _connection(self, timeout: int) -> http.client.HTTPConnection:
+        if self._conn is None:
+            conn_cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            self._conn = conn_cls(self._netloc, timeout=timeout)
+        elif self._conn.sock is not None:
+            self._conn.sock.settimeout(timeout)
+        else:
+            self._conn.timeout = timeout
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _request(self, path: str, payload: dict[str, Any], timeout: int) -> http.client.HTTPResponse:
+        """
+        POST on the shared connection; the caller must read the response fully while holding _conn_lock.
+        Transport failures are raised as urllib.error.URLError to keep the urlopen-era error contract.
+        """
         data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            f"{self.endpoint}{path}",
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            body = response.read().decode("utf-8")
-            return json.loads(body)
+        url = f"{self.endpoint}{path}"
+        for attempt in range(2):
+            conn = self._connection(timeout)
+            try:
+                conn.request("POST", f"{self._base_path}{path}", body=data, headers={"Content-Type": "application/json"})
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as exc:
+                # The server closed an idle keep-alive connection; reconnect once.
+                self._close()
+                if attempt:
+                    raise urllib.error.URLError(exc) from exc
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                self._close()
+                raise urllib.error.URLError(exc) from exc
+            if response.status >= 400:
+                response.read()
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            return response
+        raise urllib.error.URLError("unreachable")
+
+    def _post_json(self, path: str, payload: dict[str, Any], timeout: int = 60) -> dict[str, Any]:
+        with self._conn_lock:
+            response = self._request(path, payload, timeout)
+            try:
+                body = response.read().decode("utf-8")
+            except (OSError, http.client.HTTPException) as exc:
+                self._close()
+                raise urllib.error.URLError(exc) from exc
+        return json.loads(body)
+
+    def _post_stream(self, path: str, payload: dict[str, Any], timeout: int = 60) -> Iterator[dict[str, Any]]:
+        """Yield NDJSON objects as they arrive; the body is always drained so the connection stays reusable."""
+        with self._conn_lock:
+            response = self._request(path, payload, timeout)
+            drained = False
+            try:
+                for line in response:
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+                drained = True
+            except (OSError, http.client.HTTPException) as exc:
+                raise urllib.error.URLError(exc) from exc
+            finally:
+                if not drained:
+                    # A half-read response would poison the keep-alive connection.
+                    self._close()
 
     def generate(self, prompt: str, **kwargs: Any) -> str:
         start = self._start_timer()
+        on_token: Callable[[str], None] | None = kwargs.get("on_token")
         payload = {
             "model": kwargs.get("model", self.model_name),
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "options": kwargs.get("options", {}),
         }
         try:
-            raw = self._post_json("/api/generate", payload=payload)
-            output = str(raw.get("response", "")).strip()
+            chunks: list[str] = []
+            for event in self._post_stream("/api/generate", payload=payload):
+                token = str(event.get("response", ""))
+                if token:
+                    chunks.append(token)
+                    if on_token is not None:
+                        on_token(token)
+            output = "".join(chunks).strip()
             if not output:
                 output = "No model response generated."
         except urllib.error.URLError as exc:
@@ -44,18 +138,30 @@ class OllamaAdapter(BaseModelAdapter):
         return output
 
     def embed(self, text: str) -> list[float]:
+        key = (self.model_name, text)
+        with self._embed_cache_lock:
+            cached = self._embed_cache.get(key)
+            if cached is not None:
+                self._embed_cache.move_to_end(key)
+        if cached is not None:
+            return list(cached)
         try:
             raw = self._post_json("/api/embed", payload={"model": self.model_name, "input": text})
             embeddings = raw.get("embeddings") or []
             if embeddings and isinstance(embeddings, list):
                 first = embeddings[0]
                 if isinstance(first, list):
-                    return [float(v) for v in first]
+                    vector = [float(v) for v in first]
+                    # Only server embeddings are cached, so a later reachable server is not masked by fallbacks.
+                    with self._embed_cache_lock:
+                        self._embed_cache[key] = vector
+                        if len(self._embed_cache) > self._embed_cache_size:
+                            self._embed_cache.popitem(last=False)
+                    return list(vector)
         except urllib.error.URLError:
             pass
         # Stable fallback embedding for offline/local tests.
-        seed = sum(ord(c) for c in text)
-        return [float((seed * (i + 7)) % 97) / 97.0 for i in range(16)]
+        return list(_FALLBACK_EMBEDDINGS[sum(map(ord, text)) % 97])
 
     def tool_call(self, tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
         prompt = (
@@ -66,4 +172,3 @@ class OllamaAdapter(BaseModelAdapter):
         )
         message = self.generate(prompt)
         return {"tool": tool_name, "payload": payload, "status": "delegated", "model_message": message}
-
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
+# Zero-width lookahead so overlapping markers are all reported, matching independent substring checks.
+_REFLECTION_MARKER_RE = re.compile(r"(?=(assume|risk|experiment|test|always|never|guarantee))")
+# Each critique fires when none of its markers appear in the draft.
+_CRITIQUE_RULES = (
+    (frozenset(("assume",)), "No explicit assumptions listed."),
+    (frozenset(("risk",)), "Risk section missing."),
+    (frozenset(("experiment", "test")), "No concrete experiment/test step provided."),
+)
+_ABSOLUTE_CLAIM_MARKERS = frozenset(("always", "never", "guarantee"))
+
 
 @dataclass
 class ReflectionOutcome:
@@ -17,8 +28,9 @@ class ReflectionDebateLoop:
     """
 
     def run(self, draft_answer: str) -> ReflectionOutcome:
-        critiques = self._collect_critiques(draft_answer)
-        checks = self._falsification_checks(draft_answer)
+        markers = {match.group(1) for match in _REFLECTION_MARKER_RE.finditer(draft_answer.lower())}
+        critiques = self._collect_critiques(markers)
+        checks = self._falsification_checks(markers, word_count=len(draft_answer.split()))
         revised = draft_answer
         if critiques:
             revised += "\n\nRevision Notes:\n" + "\n".join(f"- {c}" for c in critiques)
@@ -26,23 +38,13 @@ class ReflectionDebateLoop:
             revised += "\n\nFalsification Checklist:\n" + "\n".join(f"- {c}" for c in checks)
         return ReflectionOutcome(revised_answer=revised, critiques=critiques, falsification_checks=checks)
 
-    def _collect_critiques(self, text: str) -> list[str]:
-        critiques: list[str] = []
-        lower = text.lower()
-        if "assume" not in lower:
-            critiques.append("No explicit assumptions listed.")
-        if "risk" not in lower:
-            critiques.append("Risk section missing.")
-        if "experiment" not in lower and "test" not in lower:
-            critiques.append("No concrete experiment/test step provided.")
-        return critiques
-
-    def _falsification_checks(self, text: str) -> list[str]:
-        checks: list[str] = []
-        if any(token in text.lower() for token in ("always", "never", "guarantee")):
-            checks.append("Absolute claims detected; require counter-example search.")
-        if len(text.split()) < 70:
-            checks.append("Answer may be under-specified for scientific reproducibility.")
-        checks.append("Validate against held-out benchmark tasks before acceptance.")
-        return checks
+    def _collect_critiques(self, markers: set[str]) -> list[str]:
+        return [message for required, message in _CRITIQUE_RULES if markers.isdisjoint(required)]
 
+    def _falsification_checks(self, markers: set[str], word_count: int) -> list[str]:
+        rules = (
+            (not markers.isdisjoint(_ABSOLUTE_CLAIM_MARKERS), "Absolute claims detected; require counter-example search."),
+            (word_count < 70, "Answer may be under-specified for scientific reproducibility."),
+            (True, "Validate against held-out benchmark tasks before acceptance."),
+        )
+        return [message for triggered, message in rules if triggered]
@@ -1,29 +1,58 @@
 from __future__ import annotations
 
+import calendar
+import functools
 import json
-from datetime import datetime
+import re
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .json_cache import load_json_cached, replace_file_if_changed
+
+_REQUIRED_EVIDENCE_FIELDS = ("citation", "artifact_hash", "retrieval_date", "verification_method")
+_ISO_DATE_RE = re.compile(r"(?!0000)([0-9]{4})-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])")
+
+
+def _coerce_metrics(metrics: Any) -> dict[str, float] | None:
+    """Float view of an observed-metrics mapping; non-numeric entries are left out, non-mappings give None."""
+    if not isinstance(metrics, dict):
+        return None
+    coerced: dict[str, float] = {}
+    for key, value in metrics.items():
+        try:
+            coerced[key] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return coerced
+
+
+@functools.lru_cache(maxsize=16)
+def _placeholder_pattern(tokens: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(token) for token in tokens if token))
+
 
 class ExternalBaselineAttestationService:
     def __init__(
         self,
         registry_path: str = "config/frontier_baselines.json",
-        policy_path: str = "config/repro_policy.json",
+        policy_path: str | None = "config/repro_policy.json",
     ) -> None:
         self.registry_path = Path(registry_path)
-        self.policy_path = Path(policy_path)
+        # None pins the built-in attestation gates without consulting a policy file.
+        self.policy_path = Path(policy_path) if policy_path is not None else None
+        self._indexed_rows: list[Any] | None = None
+        self._id_index: dict[str, int] = {}
 
     def _load_policy(self) -> dict[str, Any]:
         default_policy: dict[str, Any] = {
             "min_overlap_metrics": 2,
             "disallowed_placeholder_tokens": ["unknown", "pending", "placeholder", "tbd"],
         }
-        if not self.policy_path.exists():
+        if self.policy_path is None:
             return default_policy
         try:
-            payload = json.loads(self.policy_path.read_text(encoding="utf-8"))
+            payload = load_json_cached(self.policy_path)
             gates = payload.get("attestation_gates", {})
             tokens = gates.get("disallowed_placeholder_tokens", default_policy["disallowed_placeholder_tokens"])
             token_list = [str(token).strip().lower() for token in tokens if str(token).strip()]
@@ -42,23 +71,82 @@ class ExternalBaselineAttestationService:
         eval_report: dict[str, Any],
         max_metric_delta: float = 0.02,
     ) -> dict[str, Any]:
+        return self.attest_batch([baseline_id], eval_report, max_metric_delta=max_metric_delta)["results"][0]
+
+    def attest_batch(
+        self,
+        baseline_ids: list[str],
+        eval_report: dict[str, Any],
+        max_metric_delta: float = 0.02,
+    ) -> dict[str, Any]:
+        """
+        Attest several baselines against one eval report.
+        Policy and registry are loaded once, all rows share one timestamp, and the registry is written once.
+        """
         policy = self._load_policy()
         min_overlap_metrics = int(policy["min_overlap_metrics"])
-        placeholder_tokens = list(policy["disallowed_placeholder_tokens"])
+        placeholder_re = _placeholder_pattern(tuple(policy["disallowed_placeholder_tokens"]))
         registry = self._load_registry()
         baselines = registry.get("baselines", [])
         if not isinstance(baselines, list):
             baselines = []
-        index = self._find_index(baselines=baselines, baseline_id=baseline_id)
-        if index < 0:
-            return {
-                "status": "error",
-                "reason": f"baseline not found: {baseline_id}",
-                "baseline_id": baseline_id,
-                "registry_path": str(self.registry_path),
-            }
+        timestamp = datetime.now(timezone.utc).isoformat()
+        progress = eval_report.get("benchmark_progress", {})
+        observed = _coerce_metrics(progress.get("observed", {}))
+        observed_suite = str(progress.get("suite_id", "unknown-suite"))
+        observed_scoring = str(eval_report.get("benchmark_provenance", {}).get("scoring_reference", "unknown-scoring"))
+        results: list[dict[str, Any]] = []
+        for baseline_id in baseline_ids:
+            index = self._find_index(baseline_id)
+            if index < 0:
+                results.append(
+                    {
+                        "status": "error",
+                        "reason": f"baseline not found: {baseline_id}",
+                        "baseline_id": baseline_id,
+                        "registry_path": str(self.registry_path),
+                    }
+                )
+                continue
+            baselines[index], result = self._attest_row(
+                row=baselines[index],
+                baseline_id=baseline_id,
+                observed=observed,
+                observed_suite=observed_suite,
+                observed_scoring=observed_scoring,
+                max_metric_delta=max_metric_delta,
+                min_overlap_metrics=min_overlap_metrics,
+                placeholder_re=placeholder_re,
+                timestamp=timestamp,
+            )
+            results.append(result)
+
+        if any(result["status"] == "ok" for result in results):
+            registry["baselines"] = baselines
+            replace_file_if_changed(self.registry_path, json.dumps(registry, indent=2, ensure_ascii=False).encode("utf-8"))
+        return {
+            "status": "ok",
+            "attested": sum(1 for result in results if result.get("action") == "attested"),
+            "rejected": sum(1 for result in results if result.get("action") == "rejected"),
+            "errors": sum(1 for result in results if result["status"] == "error"),
+            "results": results,
+            "registry_path": str(self.registry_path),
+        }
 
-        baseline = dict(baselines[index])
+    def _attest_row(
+        self,
+        *,
+        row: dict[str, Any],
+        baseline_id: str,
+        observed: dict[str, float] | None,
+        observed_suite: str,
+        observed_scoring: str,
+        max_metric_delta: float,
+        min_overlap_metrics: int,
+        placeholder_re: re.Pattern[str],
+        timestamp: str,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        baseline = dict(row)
         reasons: list[str] = []
         metric_report: dict[str, dict[str, Any]] = {}
         pass_flag = True
@@ -69,18 +157,13 @@ class ExternalBaselineAttestationService:
             reasons.append("attestation is only allowed for external baselines")
         source = str(baseline.get("source", ""))
         source_date = str(baseline.get("source_date", ""))
-        if self._contains_placeholder_token(source, placeholder_tokens):
+        if self._contains_placeholder_token(source, placeholder_re):
             pass_flag = False
             reasons.append("source metadata appears placeholder or unknown")
         if not self._is_iso_date(source_date):
             pass_flag = False
             reasons.append("source_date must be ISO-8601 date (YYYY-MM-DD)")
 
-        progress = eval_report.get("benchmark_progress", {})
-        observed = progress.get("observed", {})
-        observed_suite = str(progress.get("suite_id", "unknown-suite"))
-        observed_scoring = str(eval_report.get("benchmark_provenance", {}).get("scoring_reference", "unknown-scoring"))
-
         expected_suite = str(baseline.get("suite_id", "unknown-suite"))
         if expected_suite != observed_suite:
             pass_flag = False
@@ -92,23 +175,19 @@ class ExternalBaselineAttestationService:
             reasons.append("scoring protocol mismatch between baseline and eval report")
 
         evidence = baseline.get("evidence", {})
-        if not isinstance(evidence, dict):
-            evidence = {}
-        missing_evidence_fields = [
-            name
-            for name in ("citation", "artifact_hash", "retrieval_date", "verification_method")
-            if not str(evidence.get(name, "")).strip()
-        ]
+        # Copied because the registry rows are shared with the JSON load cache.
+        evidence = dict(evidence) if isinstance(evidence, dict) else {}
+        missing_evidence_fields = [name for name in _REQUIRED_EVIDENCE_FIELDS if not str(evidence.get(name, "")).strip()]
         if missing_evidence_fields:
             pass_flag = False
             reasons.append(f"missing evidence fields: {missing_evidence_fields}")
         citation = str(evidence.get("citation", ""))
         verification_method = str(evidence.get("verification_method", ""))
         retrieval_date = str(evidence.get("retrieval_date", ""))
-        if citation and self._contains_placeholder_token(citation, placeholder_tokens):
+        if citation and self._contains_placeholder_token(citation, placeholder_re):
             pass_flag = False
             reasons.append("citation appears placeholder or unknown")
-        if verification_method and self._contains_placeholder_token(verification_method, placeholder_tokens):
+        if verification_method and self._contains_placeholder_token(verification_method, placeholder_re):
             pass_flag = False
             reasons.append("verification_method appears placeholder or unknown")
         if retrieval_date and not self._is_iso_date(retrieval_date):
@@ -120,7 +199,7 @@ class ExternalBaselineAttestationService:
             pass_flag = False
             reasons.append("baseline metrics missing")
             baseline_metrics = {}
-        if not isinstance(observed, dict):
+        if observed is None:
             pass_flag = False
             reasons.append("eval report observed metrics missing")
             observed = {}
@@ -133,30 +212,31 @@ class ExternalBaselineAttestationService:
             pass_flag = False
             reasons.append(f"insufficient overlapping metrics: {len(overlap)} < {min_overlap_metrics}")
 
+        threshold = round(max_metric_delta, 6)
         for metric in overlap:
-            ours = float(observed[metric])
+            ours = observed[metric]
             theirs = float(baseline_metrics[metric])
             abs_delta = abs(ours - theirs)
-            metric_pass = abs_delta <= max_metric_delta
-            if not metric_pass:
-                pass_flag = False
-                reasons.append(f"metric delta exceeds threshold for {metric}")
             metric_report[metric] = {
                 "observed": ours,
                 "baseline": theirs,
                 "abs_delta": round(abs_delta, 6),
-                "threshold": round(max_metric_delta, 6),
-                "pass": metric_pass,
+                "threshold": threshold,
+                "pass": abs_delta <= max_metric_delta,
             }
+        failing_metrics = [metric for metric, row in metric_report.items() if not row["pass"]]
+        if failing_metrics:
+            pass_flag = False
+            reasons.extend(f"metric delta exceeds threshold for {metric}" for metric in failing_metrics)
 
         replication_status = "replicated-internal-harness" if pass_flag else "replication-failed"
         verified_effective = pass_flag
         evidence["replication_status"] = replication_status
         evidence["attestation"] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "suite_id": observed_suite,
             "scoring_protocol": observed_scoring,
-            "max_metric_delta": round(max_metric_delta, 6),
+            "max_metric_delta": threshold,
             "min_overlap_metrics": min_overlap_metrics,
             "metrics_checked": overlap,
             "pass": pass_flag,
@@ -164,60 +244,56 @@ class ExternalBaselineAttestationService:
         }
         baseline["evidence"] = evidence
         baseline["verified"] = verified_effective
-        baselines[index] = baseline
-        registry["baselines"] = baselines
-        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-        self.registry_path.write_text(json.dumps(registry, indent=2, ensure_ascii=True), encoding="utf-8")
 
-        return {
+        return baseline, {
             "status": "ok",
             "baseline_id": baseline_id,
             "action": "attested" if pass_flag else "rejected",
             "attestation_passed": pass_flag,
             "verified_effective": verified_effective,
             "replication_status": replication_status,
-            "max_metric_delta": round(max_metric_delta, 6),
+            "max_metric_delta": threshold,
             "min_overlap_metrics": min_overlap_metrics,
             "metric_report": metric_report,
             "reasons": reasons,
             "registry_path": str(self.registry_path),
         }
 
-    def _contains_placeholder_token(self, value: str, tokens: list[str]) -> bool:
+    def _contains_placeholder_token(self, value: str, pattern: re.Pattern[str]) -> bool:
         normalized = value.strip().lower()
-        if not normalized:
-            return True
-        for token in tokens:
-            if token and token in normalized:
-                return True
-        return False
+        return not normalized or pattern.search(normalized) is not None
 
     def _is_iso_date(self, value: str) -> bool:
-        payload = value.strip()
-        if not payload:
-            return False
-        try:
-            datetime.fromisoformat(payload)
-            return len(payload) == 10
-        except ValueError:
+        match = _ISO_DATE_RE.fullmatch(value.strip())
+        if match is None:
             return False
+        day = int(match.group(3))
+        # Only days 29-31 need the calendar to rule out dates such as 2023-02-29.
+        return day <= 28 or day <= calendar.monthrange(int(match.group(1)), int(match.group(2)))[1]
 
     def _load_registry(self) -> dict[str, Any]:
         default_payload: dict[str, Any] = {"registry_version": "unspecified", "baselines": []}
-        if not self.registry_path.exists():
-            return default_payload
         try:
-            payload = json.loads(self.registry_path.read_text(encoding="utf-8"))
-            if not isinstance(payload, dict):
-                return default_payload
-            if "baselines" not in payload or not isinstance(payload.get("baselines"), list):
-                payload["baselines"] = []
-            return payload
+            payload = load_json_cached(self.registry_path)
         except Exception:  # noqa: BLE001
+            self._indexed_rows = None
+            self._id_index = {}
+            return default_payload
+        if not isinstance(payload, dict):
+            self._indexed_rows = None
+            self._id_index = {}
             return default_payload
+        baselines = payload.get("baselines")
+        if not isinstance(baselines, list):
+            baselines = []
+        if baselines is not self._indexed_rows:
+            # Rebuilt only when the registry was re-parsed; the first row wins on duplicate ids.
+            self._indexed_rows = baselines
+            self._id_index = {}
+            for idx, row in enumerate(baselines):
+                self._id_index.setdefault(str(row.get("baseline_id", "")), idx)
+        # The cached parse is shared: copy the containers this service mutates, never the rows themselves.
+        return {**payload, "baselines": list(baselines)}
 
-    def _find_index(self, baselines: list[dict[str, Any]], baseline_id: str) -> int:
-        for idx, row in enumerate(baselines):
-            if str(row.get("baseline_id", "")) == baseline_id:
-                return idx
-        return -1
+    def _find_index(self, baseline_id: str) -> int:
+        return self._id_index.get(baseline_id, -1)
@@ -12,15 +12,23 @@ class ExternalBaselineIngestionService:
         self.registry_path = Path(registry_path)
 
     def ingest_file(self, input_path: str) -> dict[str, Any]:
+        return self.apply_parsed(self.parse_file(input_path))
+
+    def parse_file(self, input_path: str) -> dict[str, Any]:
+        """
+        Read and decode one payload file without touching the registry, so it is safe to run concurrently.
+        Returns {"status": "parsed", "payload", "input_hash"} or the error result ingest_file would report.
+        """
         path = Path(input_path)
-        if not path.exists():
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             return {
                 "status": "error",
                 "reason": f"input file not found: {path}",
                 "registry_path": str(self.registry_path),
                 "warnings": [],
             }
-        raw = path.read_text(encoding="utf-8")
         input_hash = "sha256:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
         try:
             payload = json.loads(raw)
@@ -32,7 +40,13 @@ class ExternalBaselineIngestionService:
                 "input_hash": input_hash,
                 "warnings": [],
             }
-        return self.ingest_payload(payload=payload, input_hash=input_hash)
+        return {"status": "parsed", "payload": payload, "input_hash": input_hash}
+
+    def apply_parsed(self, parsed: dict[str, Any]) -> dict[str, Any]:
+        """Apply a parse_file result to the registry; calls must be serialized."""
+        if parsed.get("status") != "parsed":
+            return parsed
+        return self.ingest_payload(payload=parsed["payload"], input_hash=str(parsed["input_hash"]))
 
     def ingest_payload(self, payload: dict[str, Any], input_hash: str = "") -> dict[str, Any]:
         errors = self._validate_payload(payload)
@@ -73,7 +87,7 @@ class ExternalBaselineIngestionService:
         if "registry_version" not in registry:
             registry["registry_version"] = "unspecified"
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-        self.registry_path.write_text(json.dumps(registry, indent=2, ensure_ascii=True), encoding="utf-8")
+        self.registry_path.write_text(json.dumps(registry, indent=2, ensure_ascii=False), encoding="utf-8")
         return {
             "status": "ok",
             "action": action,
@@ -92,10 +106,8 @@ class ExternalBaselineIngestionService:
             "notes": "Baseline registry generated by ingestion service.",
             "baselines": [],
         }
-        if not self.registry_path.exists():
-            return default_payload
         try:
-            payload = json.loads(self.registry_path.read_text(encoding="utf-8"))
+            payload = json.loads(self.registry_path.read_bytes())
             if not isinstance(payload, dict):
                 return default_payload
             if "baselines" not in payload or not isinstance(payload.get("baselines"), list):
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
-import copy
+import functools
 import hashlib
 import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .baseline_ingestion import ExternalBaselineIngestionService
+from .json_cache import load_json_cached
+
+if TYPE_CHECKING:
+    from .baseline_ingestion import ExternalBaselineIngestionService
+
+# json.dumps builds a fresh encoder whenever non-default options are passed; this one is reused.
+_PATCH_HASH_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=True)
+_TOP_LEVEL_FIELDS = (
+    "label",
+    "source_type",
+    "source",
+    "source_date",
+    "suite_id",
+    "scoring_protocol",
+    "verified",
+    "enabled",
+    "notes",
+)
 
 
 class ExternalBaselineNormalizationService:
     def __init__(self, registry_path: str = "config/frontier_baselines.json") -> None:
         self.registry_path = Path(registry_path)
-        self.ingestion = ExternalBaselineIngestionService(registry_path=registry_path)
+        self._indexed_rows: list[Any] | None = None
+        self._id_index: dict[str, int] = {}
+
+    @functools.cached_property
+    def ingestion(self) -> ExternalBaselineIngestionService:
+        # Imported on first use: lookups and patch hashing never touch the ingestion service.
+        from .baseline_ingestion import ExternalBaselineIngestionService
+
+        return ExternalBaselineIngestionService(registry_path=str(self.registry_path))
 
     def normalize_payload(
         self,
@@ -36,8 +61,8 @@ class ExternalBaselineNormalizationService:
         if not isinstance(baselines, list):
             baselines = []
 
-        target = next((row for row in baselines if str(row.get("baseline_id", "")) == baseline_id), None)
-        if target is None:
+        index = self._id_index.get(baseline_id, -1)
+        if index < 0:
             return {
                 "status": "error",
                 "reason": f"baseline not found: {baseline_id}",
@@ -45,24 +70,18 @@ class ExternalBaselineNormalizationService:
                 "registry_path": str(self.registry_path),
             }
 
-        before_row = copy.deepcopy(target)
-        merged = copy.deepcopy(target)
+        target = baselines[index]
+        # A shallow copy suffices: the evidence and metrics dicts are copied before being patched below,
+        # and nothing downstream mutates nested values, so `target` itself stays untouched for the diff.
+        merged = dict(target)
         merged["baseline_id"] = baseline_id
 
-        top_level_fields = [
-            "label",
-            "source_type",
-            "source",
-            "source_date",
-            "suite_id",
-            "scoring_protocol",
-            "verified",
-            "enabled",
-            "notes",
-        ]
-        for field in top_level_fields:
-            if field in patch:
-                merged[field] = patch[field]
+        # Changes are recorded while merging, so only keys the patch (or alignment) touches are compared.
+        touched_fields = {field for field in _TOP_LEVEL_FIELDS if field in patch}
+        for field in touched_fields:
+            merged[field] = patch[field]
+        evidence_changes: list[str] = []
+        metric_changes: list[str] = []
 
         evidence_patch = patch.get("evidence")
         if evidence_patch is not None:
@@ -73,9 +92,14 @@ class ExternalBaselineNormalizationService:
                     "baseline_id": baseline_id,
                     "registry_path": str(self.registry_path),
                 }
-            evidence = dict(merged.get("evidence", {}))
+            before_evidence = merged.get("evidence", {})
+            evidence = dict(before_evidence)
             evidence.update(evidence_patch)
             merged["evidence"] = evidence
+            if isinstance(before_evidence, dict):
+                evidence_changes = [
+                    f"evidence.{key}" for key in sorted(evidence_patch) if before_evidence.get(key) != evidence[key]
+                ]
 
         metrics_patch = patch.get("metrics")
         if metrics_patch is not None:
@@ -86,17 +110,26 @@ class ExternalBaselineNormalizationService:
                     "baseline_id": baseline_id,
                     "registry_path": str(self.registry_path),
                 }
-            metrics = {} if replace_metrics else dict(merged.get("metrics", {}))
+            before_metrics = merged.get("metrics", {})
+            metrics = {} if replace_metrics else dict(before_metrics)
             metrics.update(metrics_patch)
             merged["metrics"] = metrics
+            if isinstance(before_metrics, dict):
+                # Replacing metrics also drops keys the patch does not mention.
+                metric_keys = set(metrics_patch) | set(before_metrics) if replace_metrics else metrics_patch
+                metric_changes = [
+                    f"metrics.{key}" for key in sorted(metric_keys) if before_metrics.get(key) != metrics.get(key)
+                ]
 
         if align_to_eval:
             suite_id = str((eval_report or {}).get("benchmark_progress", {}).get("suite_id", "")).strip()
             scoring_protocol = str((eval_report or {}).get("benchmark_provenance", {}).get("scoring_reference", "")).strip()
             if suite_id:
                 merged["suite_id"] = suite_id
+                touched_fields.add("suite_id")
             if scoring_protocol:
                 merged["scoring_protocol"] = scoring_protocol
+                touched_fields.add("scoring_protocol")
 
         patch_hash = self._patch_hash(
             baseline_id=baseline_id,
@@ -109,7 +142,11 @@ class ExternalBaselineNormalizationService:
         result["normalize_applied"] = result.get("status") == "ok"
         result["align_to_eval"] = align_to_eval
         result["replace_metrics"] = replace_metrics
-        result["changed_fields"] = self._changed_fields(before=before_row, after=merged)
+        result["changed_fields"] = [
+            *(field for field in _TOP_LEVEL_FIELDS if field in touched_fields and target.get(field) != merged[field]),
+            *evidence_changes,
+            *metric_changes,
+        ]
         result["patch_hash"] = patch_hash
         result["disclaimer"] = (
             "Normalization updates metadata only from explicit patch input. "
@@ -119,17 +156,27 @@ class ExternalBaselineNormalizationService:
 
     def _load_registry(self) -> dict[str, Any]:
         default_payload: dict[str, Any] = {"registry_version": "unspecified", "baselines": []}
-        if not self.registry_path.exists():
-            return default_payload
         try:
-            payload = json.loads(self.registry_path.read_text(encoding="utf-8"))
-            if not isinstance(payload, dict):
-                return default_payload
-            if "baselines" not in payload or not isinstance(payload.get("baselines"), list):
-                payload["baselines"] = []
-            return payload
+            payload = load_json_cached(self.registry_path)
         except Exception:  # noqa: BLE001
+            self._indexed_rows = None
+            self._id_index = {}
+            return default_payload
+        if not isinstance(payload, dict):
+            self._indexed_rows = None
+            self._id_index = {}
             return default_payload
+        baselines = payload.get("baselines")
+        if not isinstance(baselines, list):
+            baselines = []
+        if baselines is not self._indexed_rows:
+            # Rebuilt only when the registry was re-parsed; the first row wins on duplicate ids.
+            self._indexed_rows = baselines
+            self._id_index = {}
+            for idx, row in enumerate(baselines):
+                self._id_index.setdefault(str(row.get("baseline_id", "")), idx)
+        # The cached parse is shared and read-only here; rows are copied before merging.
+        return {**payload, "baselines": baselines}
 
     def _patch_hash(
         self,
@@ -145,37 +192,5 @@ class ExternalBaselineNormalizationService:
             "align_to_eval": align_to_eval,
             "replace_metrics": replace_metrics,
         }
-        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+        encoded = _PATCH_HASH_ENCODER.encode(payload).encode("ascii")
         return "sha256:" + hashlib.sha256(encoded).hexdigest()
-
-    def _changed_fields(self, *, before: dict[str, Any], after: dict[str, Any]) -> list[str]:
-        changed: list[str] = []
-        top_level_fields = [
-            "label",
-            "source_type",
-            "source",
-            "source_date",
-            "suite_id",
-            "scoring_protocol",
-            "verified",
-            "enabled",
-            "notes",
-        ]
-        for field in top_level_fields:
-            if before.get(field) != after.get(field):
-                changed.append(field)
-
-        before_evidence = before.get("evidence", {})
-        after_evidence = after.get("evidence", {})
-        if isinstance(before_evidence, dict) and isinstance(after_evidence, dict):
-            for key in sorted(set(before_evidence.keys()) | set(after_evidence.keys())):
-                if before_evidence.get(key) != after_evidence.get(key):
-                    changed.append(f"evidence.{key}")
-
-        before_metrics = before.get("metrics", {})
-        after_metrics = after.get("metrics", {})
-        if isinstance(before_metrics, dict) and isinstance(after_metrics, dict):
-            for key in sorted(set(before_metrics.keys()) | set(after_metrics.keys())):
-                if before_metrics.get(key) != after_metrics.get(key):
-                    changed.append(f"metrics.{key}")
-        return changed
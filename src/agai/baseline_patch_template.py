@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .baseline_registry import DeclaredBaselineComparator
+from .json_cache import load_json_cached
 
 
 class ExternalBaselinePatchTemplateService:
     def __init__(self, registry_path: str = "config/frontier_baselines.json") -> None:
         self.registry_path = Path(registry_path)
+        self.comparator = DeclaredBaselineComparator(registry_path=registry_path)
 
     def build_template(
         self,
@@ -27,7 +28,9 @@ class ExternalBaselinePatchTemplateService:
                 "registry_path": str(self.registry_path),
             }
 
-        reasons = self._comparability_reasons(baseline_id=baseline_id, eval_report=eval_report)
+        # The comparator scores the whole registry, so it runs once and feeds both reasons and comparable.
+        comparability_row = self._comparability_row(baseline_id=baseline_id, eval_report=eval_report)
+        reasons = self._comparability_reasons(comparability_row)
         reason_set = {str(reason) for reason in reasons}
         patch_template: dict[str, Any] = {}
         checklist: list[str] = []
@@ -115,10 +118,6 @@ class ExternalBaselinePatchTemplateService:
         if not patch_template:
             checklist.append("No normalization patch required from current comparability reasons.")
 
-        comparability_row = self._comparability_row(
-            baseline_id=baseline_id,
-            eval_report=eval_report,
-        )
         comparable = bool(comparability_row.get("comparability", {}).get("comparable", False))
         template = {
             "status": "ok",
@@ -159,8 +158,7 @@ class ExternalBaselinePatchTemplateService:
     def _comparability_row(self, *, baseline_id: str, eval_report: dict[str, Any] | None) -> dict[str, Any]:
         if not isinstance(eval_report, dict):
             return {}
-        comparator = DeclaredBaselineComparator(registry_path=str(self.registry_path))
-        comparison = comparator.compare(eval_report)
+        comparison = self.comparator.compare(eval_report)
         rows = comparison.get("comparisons", [])
         if not isinstance(rows, list):
             return {}
@@ -169,8 +167,7 @@ class ExternalBaselinePatchTemplateService:
                 return row
         return {}
 
-    def _comparability_reasons(self, *, baseline_id: str, eval_report: dict[str, Any] | None) -> list[str]:
-        row = self._comparability_row(baseline_id=baseline_id, eval_report=eval_report)
+    def _comparability_reasons(self, row: dict[str, Any]) -> list[str]:
         reasons = row.get("comparability", {}).get("reasons", [])
         if not isinstance(reasons, list):
             return []
@@ -212,14 +209,12 @@ class ExternalBaselinePatchTemplateService:
 
     def _load_registry(self) -> dict[str, Any]:
         default_payload: dict[str, Any] = {"registry_version": "unspecified", "baselines": []}
-        if not self.registry_path.exists():
-            return default_payload
         try:
-            payload = json.loads(self.registry_path.read_text(encoding="utf-8"))
+            payload = load_json_cached(self.registry_path)
             if not isinstance(payload, dict):
                 return default_payload
             if "baselines" not in payload or not isinstance(payload.get("baselines"), list):
-                payload["baselines"] = []
+                return {**payload, "baselines": []}
             return payload
         except Exception:  # noqa: BLE001
             return default_payload
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-import json
 from pathlib import Path
 from statistics import mean
 from typing import Any
 
+from .json_cache import load_json_cached
+
 
 class DeclaredBaselineComparator:
     def __init__(self, registry_path: str = "config/frontier_baselines.json") -> None:
@@ -78,14 +79,13 @@ class DeclaredBaselineComparator:
 
     def _load_registry(self) -> dict[str, Any]:
         default_payload: dict[str, Any] = {"registry_version": "none", "baselines": []}
-        if not self.registry_path.exists():
-            return default_payload
         try:
-            payload = json.loads(self.registry_path.read_text(encoding="utf-8"))
+            # Shared with other readers of the same file, so the parsed payload is never mutated here.
+            payload = load_json_cached(self.registry_path)
             if not isinstance(payload, dict):
                 return default_payload
             if "baselines" not in payload or not isinstance(payload.get("baselines"), list):
-                payload["baselines"] = []
+                return {**payload, "baselines": []}
             return payload
         except Exception:  # noqa: BLE001
             return default_payload
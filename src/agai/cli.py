@@ -324,9 +324,11 @@ def main() -> None:
         parser.error(f"Unsupported command: {args.command}")
         return
 
-    print(json.dumps(output, indent=2, ensure_ascii=True))
+    # Serialized once: the printed report and the artifact are the same text.
+    rendered = json.dumps(output, indent=2, ensure_ascii=True)
+    print(rendered)
     out_file = Path(args.artifacts_dir) / f"last_{args.command}.json"
-    out_file.write_text(json.dumps(output, indent=2, ensure_ascii=True), encoding="utf-8")
+    out_file.write_text(rendered, encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from statistics import mean
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
 
+from .json_cache import load_json_cached
 from .orchestration import MultiAgentOrchestrator
 from .quantum_suite import (
     adversarial_quantum_suite,
@@ -14,12 +15,24 @@ from .quantum_suite import (
     suite_leakage_report,
 )
 from .reality_guard import RealityGuard
-from .types import Scorecard, TaskSpec
+from .types import ResultBundle, Scorecard, TaskSpec
+
+# Every suite case runs under the same constraints and budget. The templates are immutable and each
+# TaskSpec gets its own list/dict copy, so an edit to one task never leaks into another case.
+_CASE_CONSTRAINTS = ("single-consumer-laptop", "strict budget", "falsification required")
+_CASE_BUDGET = MappingProxyType(
+    {"max_tokens": 3500, "max_latency_ms": 80_000, "max_energy_joules": 220.0, "max_usd": 0.12}
+)
+
+
+def _mean(values: list[float]) -> float:
+    return float(mean(values)) if values else 0.0
 
 
 class Evaluator:
-    def __init__(self, benchmark_target_path: str = "config/benchmark_targets.json") -> None:
+    def __init__(self, benchmark_target_path: str = "config/benchmark_targets.json", max_case_workers: int = 1) -> None:
         self.benchmark_target_path = benchmark_target_path
+        self.max_case_workers = max(1, max_case_workers)
         self.reality_guard = RealityGuard()
 
     def _load_targets(self) -> dict[str, float]:
@@ -44,11 +57,8 @@ class Evaluator:
             "min_specialist_holdout_aggregate_delta": 0.0,
             "min_specialist_adversarial_aggregate_delta": 0.0,
         }
-        path = Path(self.benchmark_target_path)
-        if not path.exists():
-            return default_targets
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = load_json_cached(self.benchmark_target_path)
             targets = payload.get("targets", {})
             return {
                 "min_case_score": float(targets.get("min_case_score", default_targets["min_case_score"])),
@@ -113,11 +123,8 @@ class Evaluator:
             return default_targets
 
     def _load_suite_id(self) -> str:
-        path = Path(self.benchmark_target_path)
-        if not path.exists():
-            return "unknown-suite"
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = load_json_cached(self.benchmark_target_path)
             suite_id = payload.get("suite_id")
             if suite_id is None:
                 return "unknown-suite"
@@ -125,16 +132,44 @@ class Evaluator:
         except Exception:  # noqa: BLE001
             return "unknown-suite"
 
+    def _case_task(self, case: Any) -> TaskSpec:
+        return TaskSpec(
+            goal=case.prompt,
+            constraints=list(_CASE_CONSTRAINTS),
+            success_metric="measurable-improvement-on-defined-hard-suite",
+            budget=dict(_CASE_BUDGET),
+            deadline="immediate",
+            domain=case.domain,
+        )
+
+    def _map_cases(self, run: Callable[[Any], ResultBundle], cases: list) -> list[ResultBundle]:
+        # Cases share adapters, the provenance store and the trace file, so concurrency is opt-in
+        # (max_case_workers > 1); map() keeps results in case order either way.
+        workers = min(self.max_case_workers, len(cases))
+        if workers <= 1:
+            return [run(case) for case in cases]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, cases))
+
+    def _run_multi(self, cases: list, orchestrator: MultiAgentOrchestrator) -> list[ResultBundle]:
+        return self._map_cases(lambda case: orchestrator.solve(self._case_task(case), rounds=2), cases)
+
     def _evaluate_split(
         self,
         cases: list,
         orchestrator: MultiAgentOrchestrator,
         baseline_agent_id: str,
         baseline_mode: str = "specialist",
+        multi_runs: list[ResultBundle] | None = None,
     ) -> dict[str, object]:
+        """
+        Score one split against a single-agent baseline.
+        `multi_runs` lets callers reuse multi-agent results already computed for the same cases.
+        """
         multi_scores: list[float] = []
         baseline_scores: list[float] = []
-        latencies: list[int] = []
+        latency_total_ms = 0
+        pass_count = 0
         costs: list[float] = []
         energies: list[float] = []
         contradictions = 0
@@ -148,22 +183,18 @@ class Evaluator:
             "budget_limit_triggered": 0,
         }
 
-        for case in cases:
-            task = TaskSpec(
-                goal=case.prompt,
-                constraints=["single-consumer-laptop", "strict budget", "falsification required"],
-                success_metric="measurable-improvement-on-defined-hard-suite",
-                budget={"max_tokens": 3500, "max_latency_ms": 80_000, "max_energy_joules": 220.0, "max_usd": 0.12},
-                deadline="immediate",
-                domain=case.domain,
-            )
-            multi = orchestrator.solve(task, rounds=2)
-            baseline = orchestrator.run_single_agent_baseline_with_mode(
-                task,
+        if multi_runs is None:
+            multi_runs = self._run_multi(cases, orchestrator)
+        baseline_runs = self._map_cases(
+            lambda case: orchestrator.run_single_agent_baseline_with_mode(
+                self._case_task(case),
                 agent_id=baseline_agent_id,
                 mode=baseline_mode,
-            )
+            ),
+            cases,
+        )
 
+        for case, multi, baseline in zip(cases, multi_runs, baseline_runs):
             multi_answer = str(multi.outcomes.get("final_answer", ""))
             base_answer = str(baseline.outcomes.get("final_answer", ""))
             multi_score = score_quantum_answer(case.expected, multi_answer)
@@ -175,14 +206,18 @@ class Evaluator:
                 overclaim_cases += 1
             multi_scores.append(multi_score)
             baseline_scores.append(base_score)
+            # Scores are clamped to [0, 1], so one comparison serves the pass count, taxonomy and details.
+            passed = multi_score >= 0.62
+            if passed:
+                pass_count += 1
 
             budget = multi.outcomes.get("budget_spent", {})
-            latencies.append(int(budget.get("latency_ms", 0)))
+            latency_total_ms += int(budget.get("latency_ms", 0))
             costs.append(float(budget.get("usd_cost", 0.0)))
             energies.append(float(budget.get("energy_joules", 0.0)))
             contradictions += len(multi.contradictions)
             has_budget_limit = "budget exceeded" in multi_answer.lower()
-            if multi_score < 0.62:
+            if not passed:
                 failure_taxonomy["quality_below_threshold"] += 1
             if case_overclaim_hits > 0:
                 failure_taxonomy["overclaiming"] += 1
@@ -198,30 +233,29 @@ class Evaluator:
                     "baseline_score": base_score,
                     "baseline_mode": baseline_mode,
                     "delta": multi_score - base_score,
-                    "passed": multi_score >= 0.62,
+                    "passed": passed,
                     "overclaim_hits": case_overclaim_hits,
                     "overclaim_terms": claim_audit.get("overclaim_terms", []),
                     "reality_score": claim_audit.get("reality_score", 0.0),
                 }
             )
 
-        aggregate_delta = (mean(multi_scores) - mean(baseline_scores)) if baseline_scores else 0.0
+        multi_mean = _mean(multi_scores)
+        baseline_mean = _mean(baseline_scores)
+        aggregate_delta = (multi_mean - baseline_mean) if baseline_scores else 0.0
         overclaim_rate = (overclaim_cases / len(details)) if details else 0.0
-        pass_rate = (
-            sum(1 for score in multi_scores if score >= 0.62) / len(multi_scores)
-            if multi_scores
-            else 0.0
-        )
+        pass_rate = (pass_count / len(multi_scores)) if multi_scores else 0.0
         scorecard = Scorecard(
-            quality=mean(multi_scores) if multi_scores else 0.0,
-            latency_ms=float(mean(latencies) if latencies else 0.0),
-            cost_usd=float(mean(costs) if costs else 0.0),
-            energy_joules=float(mean(energies) if energies else 0.0),
+            quality=multi_mean,
+            # Integer true division is correctly rounded, so this matches statistics.mean exactly.
+            latency_ms=(latency_total_ms / len(multi_scores)) if multi_scores else 0.0,
+            cost_usd=_mean(costs),
+            energy_joules=_mean(energies),
             reproducibility=max(0.0, 1.0 - (contradictions * 0.1)),
             novelty=min(1.0, 0.55 + aggregate_delta),
             notes=[
-                f"average_multi_score={mean(multi_scores) if multi_scores else 0.0:.3f}",
-                f"average_baseline_score={mean(baseline_scores) if baseline_scores else 0.0:.3f}",
+                f"average_multi_score={multi_mean:.3f}",
+                f"average_baseline_score={baseline_mean:.3f}",
                 f"overclaim_rate={overclaim_rate:.3f}",
             ],
         )
@@ -266,41 +300,55 @@ class Evaluator:
         orchestrator: MultiAgentOrchestrator,
         baseline_agent_id: str,
     ) -> dict[str, object]:
+        # The multi-agent runs do not depend on the baseline mode, so each split is solved once
+        # and scored against both the generalist and the specialist baseline.
+        public_cases = default_quantum_suite()
+        holdout_cases = holdout_quantum_suite()
+        adversarial_cases = adversarial_quantum_suite()
+        public_multi = self._run_multi(public_cases, orchestrator)
+        holdout_multi = self._run_multi(holdout_cases, orchestrator)
+        adversarial_multi = self._run_multi(adversarial_cases, orchestrator)
         public = self._evaluate_split(
-            cases=default_quantum_suite(),
+            cases=public_cases,
             orchestrator=orchestrator,
             baseline_agent_id=baseline_agent_id,
             baseline_mode="generalist",
+            multi_runs=public_multi,
         )
         holdout = self._evaluate_split(
-            cases=holdout_quantum_suite(),
+            cases=holdout_cases,
             orchestrator=orchestrator,
             baseline_agent_id=baseline_agent_id,
             baseline_mode="generalist",
+            multi_runs=holdout_multi,
         )
         adversarial = self._evaluate_split(
-            cases=adversarial_quantum_suite(),
+            cases=adversarial_cases,
             orchestrator=orchestrator,
             baseline_agent_id=baseline_agent_id,
             baseline_mode="generalist",
+            multi_runs=adversarial_multi,
         )
         specialist_reference = self._evaluate_split(
-            cases=default_quantum_suite(),
+            cases=public_cases,
             orchestrator=orchestrator,
             baseline_agent_id=baseline_agent_id,
             baseline_mode="specialist",
+            multi_runs=public_multi,
         )
         specialist_reference_holdout = self._evaluate_split(
-            cases=holdout_quantum_suite(),
+            cases=holdout_cases,
             orchestrator=orchestrator,
             baseline_agent_id=baseline_agent_id,
             baseline_mode="specialist",
+            multi_runs=holdout_multi,
         )
         specialist_reference_adversarial = self._evaluate_split(
-            cases=adversarial_quantum_suite(),
+            cases=adversarial_cases,
             orchestrator=orchestrator,
             baseline_agent_id=baseline_agent_id,
             baseline_mode="specialist",
+            multi_runs=adversarial_multi,
         )
         details = public["details"]
         scorecard = public["scorecard"]
@@ -318,14 +366,24 @@ class Evaluator:
         leakage = suite_leakage_report()
 
         targets = self._load_targets()
-        per_case_gap = [
-            {
-                "case_id": row["case_id"],
-                "gap_to_min_case_score": max(0.0, float(targets["min_case_score"]) - float(row["multi_score"])),
-                "margin_over_min_case_score": float(row["multi_score"]) - float(targets["min_case_score"]),
-            }
-            for row in details
-        ]
+        # One pass over the cases yields the per-case rows plus their sum and worst margin.
+        min_case_score = float(targets["min_case_score"])
+        per_case_gap: list[dict[str, Any]] = []
+        case_gap_total = 0.0
+        worst_case_margin = -float(targets["min_case_margin"])
+        for position, row in enumerate(details):
+            multi_score = float(row["multi_score"])
+            gap = max(0.0, min_case_score - multi_score)
+            margin = multi_score - min_case_score
+            case_gap_total += gap
+            worst_case_margin = margin if position == 0 else min(worst_case_margin, margin)
+            per_case_gap.append(
+                {
+                    "case_id": row["case_id"],
+                    "gap_to_min_case_score": gap,
+                    "margin_over_min_case_score": margin,
+                }
+            )
         quality_gap = max(0.0, float(targets["min_quality"]) - float(scorecard.quality))
         pass_rate_gap = max(0.0, float(targets["min_pass_rate"]) - float(pass_rate))
         aggregate_delta_gap = max(0.0, float(targets["min_aggregate_delta"]) - float(aggregate_delta))
@@ -370,17 +428,12 @@ class Evaluator:
             float(targets["min_specialist_adversarial_aggregate_delta"])
             - float(specialist_reference_adversarial["aggregate_delta"]),
         )
-        worst_case_margin = (
-            min(row["margin_over_min_case_score"] for row in per_case_gap)
-            if per_case_gap
-            else -float(targets["min_case_margin"])
-        )
         case_margin_gap = max(0.0, float(targets["min_case_margin"]) - float(worst_case_margin))
         remaining_distance = (
             quality_gap
             + pass_rate_gap
             + aggregate_delta_gap
-            + sum(row["gap_to_min_case_score"] for row in per_case_gap)
+            + case_gap_total
             + case_margin_gap
             + holdout_quality_gap
             + split_delta_gap
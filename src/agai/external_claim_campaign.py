@@ -1,22 +1,29 @@
 from __future__ import annotations
 
-import copy
 import hashlib
 import json
+import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from . import patch_fields
 from .baseline_ingestion import ExternalBaselineIngestionService
 from .baseline_normalization import ExternalBaselineNormalizationService
 from .baseline_patch_template import ExternalBaselinePatchTemplateService
 from .external_claim_replay import ExternalClaimReplayRunner
+from .file_hashing import sha256_file
+from .json_cache import _RACY_WINDOW_NS
 
 
 class ExternalClaimSandboxCampaignRunner:
     def __init__(self, policy_path: str = "config/repro_policy.json") -> None:
         self.policy_path = policy_path
         self.replay = ExternalClaimReplayRunner(policy_path=policy_path)
+        self._snapshot_cache: dict[tuple[str, int, int, float], dict[str, Any]] = {}
+        self._snapshot_context: tuple[str, tuple[int, int] | None] | None = None
 
     def run(
         self,
@@ -48,9 +55,14 @@ class ExternalClaimSandboxCampaignRunner:
                 "source_registry_path": str(source_path),
             }
 
-        source_hash_before = self._sha256(source_path)
+        # Snapshots stay valid across runs until the eval report or the policy file changes.
+        snapshot_context = (self._eval_report_digest(eval_report), self._file_signature(self.policy_path))
+        if snapshot_context != self._snapshot_context:
+            self._snapshot_cache = {}
+            self._snapshot_context = snapshot_context
         sandbox_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source_path, sandbox_path)
+        source_stat_before = source_path.stat()
+        source_hash_before = self._copy_and_hash(source_path, sandbox_path)
 
         ingest_results = self._run_ingest_stage(
             sandbox_registry_path=sandbox_path,
@@ -74,7 +86,12 @@ class ExternalClaimSandboxCampaignRunner:
             max_metric_delta=default_max_metric_delta,
         )
 
-        source_hash_after = self._sha256(source_path)
+        # An untouched stat means the source was not rewritten; only a changed one is worth re-reading.
+        source_stat_after = source_path.stat()
+        source_unchanged = (source_stat_before.st_mtime_ns, source_stat_before.st_size) == (
+            source_stat_after.st_mtime_ns,
+            source_stat_after.st_size,
+        ) or sha256_file(source_path) == source_hash_before
         status = "ok"
         if any(str(row.get("status", "")) == "error" for row in ingest_results):
             status = "error"
@@ -87,7 +104,7 @@ class ExternalClaimSandboxCampaignRunner:
             "status": status,
             "source_registry_path": str(source_path),
             "sandbox_registry_path": str(sandbox_path),
-            "source_registry_unchanged": source_hash_before == source_hash_after,
+            "source_registry_unchanged": source_unchanged,
             "ingest_stage": {
                 "count": len(ingest_results),
                 "results": ingest_results,
@@ -129,10 +146,16 @@ class ExternalClaimSandboxCampaignRunner:
                 }
             ]
         service = ExternalBaselineIngestionService(registry_path=str(sandbox_registry_path))
+        path_strs = [str(payload_path) for payload_path in ingest_payload_paths]
+        # Reading and decoding payloads is independent per file; only the registry writes must stay in order.
+        if len(path_strs) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(path_strs))) as executor:
+                parsed_rows = list(executor.map(service.parse_file, path_strs))
+        else:
+            parsed_rows = [service.parse_file(path_str) for path_str in path_strs]
         rows: list[dict[str, Any]] = []
-        for payload_path in ingest_payload_paths:
-            path_str = str(payload_path)
-            result = service.ingest_file(path_str)
+        for path_str, parsed in zip(path_strs, parsed_rows):
+            result = service.apply_parsed(parsed)
             rows.append(
                 {
                     "status": str(result.get("status", "error")),
@@ -228,8 +251,9 @@ class ExternalClaimSandboxCampaignRunner:
             if not isinstance(override_payload, dict):
                 override_payload = {}
 
-            effective_patch = self._deep_merge(copy.deepcopy(patch_template), override_payload)
-            unresolved_fields = self._unresolved_fields(effective_patch)
+            # build_template returns freshly built dicts on every call, so the template is merged in place.
+            effective_patch = self._deep_merge(patch_template, override_payload)
+            unresolved_fields = patch_fields.unresolved_fields(effective_patch)
             step_dry_run = bool(payload.get("dry_run", False))
             align_to_eval = bool(payload.get("align_to_eval", True))
             replace_metrics = bool(payload.get("replace_metrics", False))
@@ -263,12 +287,18 @@ class ExternalClaimSandboxCampaignRunner:
                         dry_run=False,
                     )
                     step_status = "ok" if replay_result.get("status") == "ok" else "error"
+                # The registry may have been rewritten within the filesystem's mtime granularity.
+                self._snapshot_cache.clear()
 
-            after = self._distance_snapshot(
-                eval_report=eval_report,
-                registry_path=str(sandbox_registry_path),
-                max_metric_delta=max_metric_delta,
-            )
+            if apply_executed:
+                after = self._distance_snapshot(
+                    eval_report=eval_report,
+                    registry_path=str(sandbox_registry_path),
+                    max_metric_delta=max_metric_delta,
+                )
+            else:
+                # Dry-run, blocked and rejected steps never write the sandbox, so nothing can have moved.
+                after = dict(before)
             rows.append(
                 {
                     "step_index": index,
@@ -305,6 +335,50 @@ class ExternalClaimSandboxCampaignRunner:
         eval_report: dict[str, Any],
         registry_path: str,
         max_metric_delta: float,
+    ) -> dict[str, Any]:
+        # A dry-run replay only reads the registry, so an unchanged file yields the same snapshot.
+        # Files modified within the racy window are never cached: a same-size rewrite inside the
+        # timestamp granularity (or a copystat'd sandbox copy) can keep both mtime and size.
+        try:
+            stat = os.stat(registry_path)
+        except OSError:
+            stat = None
+        if stat is None or time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS:
+            return self._compute_distance_snapshot(
+                eval_report=eval_report,
+                registry_path=registry_path,
+                max_metric_delta=max_metric_delta,
+            )
+        key = (registry_path, stat.st_mtime_ns, stat.st_size, max_metric_delta)
+        snapshot = self._snapshot_cache.get(key)
+        if snapshot is None:
+            snapshot = self._compute_distance_snapshot(
+                eval_report=eval_report,
+                registry_path=registry_path,
+                max_metric_delta=max_metric_delta,
+            )
+            self._snapshot_cache[key] = snapshot
+        return dict(snapshot)
+
+    @staticmethod
+    def _eval_report_digest(eval_report: dict[str, Any]) -> str:
+        canonical = json.dumps(eval_report, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _file_signature(path: str) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _compute_distance_snapshot(
+        self,
+        *,
+        eval_report: dict[str, Any],
+        registry_path: str,
+        max_metric_delta: float,
     ) -> dict[str, Any]:
         payload = self.replay.run(
             eval_report=eval_report,
@@ -347,10 +421,10 @@ class ExternalClaimSandboxCampaignRunner:
         if not path.strip():
             return {"status": "ok", "payload": {}}
         payload_path = Path(path)
-        if not payload_path.exists():
-            return {"status": "error", "reason": f"patch overrides file not found: {payload_path}"}
         try:
-            payload = json.loads(payload_path.read_text(encoding="utf-8"))
+            payload = json.loads(payload_path.read_bytes())
+        except FileNotFoundError:
+            return {"status": "error", "reason": f"patch overrides file not found: {payload_path}"}
         except json.JSONDecodeError as exc:
             return {"status": "error", "reason": f"invalid json in patch overrides: {exc}"}
         if not isinstance(payload, dict):
@@ -358,25 +432,26 @@ class ExternalClaimSandboxCampaignRunner:
         return {"status": "ok", "payload": payload}
 
     def _deep_merge(self, base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-        for key, value in override.items():
-            if isinstance(value, dict) and isinstance(base.get(key), dict):
-                base[key] = self._deep_merge(dict(base.get(key, {})), value)
-            else:
-                base[key] = value
+        """Merge `override` into `base` in place; nested dicts present on both sides are merged key by key."""
+        stack = [(base, override)]
+        while stack:
+            target, patch = stack.pop()
+            for key, value in patch.items():
+                current = target.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return base
 
-    def _unresolved_fields(self, payload: Any, prefix: str = "") -> list[str]:
-        unresolved: list[str] = []
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                unresolved.extend(self._unresolved_fields(value, name))
-            return unresolved
-        if payload is None:
-            return [prefix] if prefix else []
-        if isinstance(payload, str) and not payload.strip():
-            return [prefix] if prefix else []
-        return []
-
-    def _sha256(self, path: Path) -> str:
-        return hashlib.sha256(path.read_bytes()).hexdigest()
+    def _copy_and_hash(self, source: Path, destination: Path) -> str:
+        """Copy `source` to `destination` like shutil.copy2 while hashing it in the same read pass."""
+        if destination.exists() and source.samefile(destination):
+            raise shutil.SameFileError(f"{source} and {destination} are the same file")
+        digest = hashlib.sha256()
+        with source.open("rb") as reader, destination.open("wb") as writer:
+            for chunk in iter(lambda: reader.read(1 << 20), b""):
+                digest.update(chunk)
+                writer.write(chunk)
+        shutil.copystat(source, destination)
+        return digest.hexdigest()
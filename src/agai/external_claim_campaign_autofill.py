@@ -2,13 +2,46 @@ from __future__ import annotations
 
 from datetime import datetime
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from . import patch_fields
+from .json_cache import replace_file_if_changed
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    return False
+
+
+def _pick_value(*values: Any) -> Any:
+    # Runs several times per baseline, so the missing check is inlined instead of calling _is_missing.
+    for value in values:
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        return value
+    return None
+
 
 class ExternalClaimCampaignAutofillService:
     _PLACEHOLDER_TOKENS = ("unknown", "pending", "placeholder", "tbd")
+    _PLACEHOLDER_RE = re.compile("|".join(map(re.escape, _PLACEHOLDER_TOKENS)))
+    _SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+    _REQUIRED_INGEST_FIELDS = (
+        "baseline_id",
+        "label",
+        "source_type",
+        "source",
+        "source_date",
+        "suite_id",
+        "scoring_protocol",
+    )
 
     def build(
         self,
@@ -41,21 +74,38 @@ class ExternalClaimCampaignAutofillService:
         if not isinstance(explicit_ingest_paths, list):
             explicit_ingest_paths = []
 
+        # The eval report is fixed for the whole build, so its harness identifiers are read once.
+        eval_suite_id = eval_report.get("benchmark_progress", {}).get("suite_id", "")
+        eval_scoring_reference = eval_report.get("benchmark_provenance", {}).get("scoring_reference", "")
+        # Nested defaults are shared by every baseline, so they are validated once here.
+        evidence_defaults = self._object_field(defaults, "evidence")
+        metrics_defaults = self._object_field(defaults, "metrics")
+        ingest_defaults = self._object_field(defaults, "ingest_payload")
+        ingest_evidence_defaults = self._object_field(ingest_defaults, "evidence")
+        ingest_metrics_defaults = self._object_field(ingest_defaults, "metrics")
         filled_patch_map: dict[str, dict[str, Any]] = {}
         filled_files: list[dict[str, Any]] = []
         unresolved_baselines: list[dict[str, Any]] = []
         generated_ingest_payloads: list[dict[str, Any]] = []
         generated_ingest_paths: list[str] = []
+        generated_resolved_count = 0
+        pending_writes: dict[Path, Any] = {}
+        resolved_baselines = 0
+        unresolved_baseline_ids: set[str] = set()
+        pending: list[tuple[str, str]] = []
         for row in generated_files:
             if not isinstance(row, dict):
                 continue
             baseline_id = str(row.get("baseline_id", "")).strip()
             patch_path = str(row.get("patch_overrides_path", "")).strip()
-            if not baseline_id or not patch_path:
-                continue
+            if baseline_id and patch_path:
+                pending.append((baseline_id, patch_path))
+        load_results = self._load_json_objects([patch_path for _, patch_path in pending])
 
-            load_result = self._load_json_object(path=patch_path)
+        # Merging stays serial and writes are keyed by output path, so rows sharing an output name keep last-row-wins.
+        for (baseline_id, _), load_result in zip(pending, load_results):
             if load_result.get("status") != "ok":
+                unresolved_baseline_ids.add(baseline_id)
                 unresolved_baselines.append(
                     {
                         "baseline_id": baseline_id,
@@ -71,11 +121,15 @@ class ExternalClaimCampaignAutofillService:
                 base_patch=scaffold_patch,
                 baseline_entry=baseline_entry,
                 defaults=defaults,
-                eval_report=eval_report,
+                evidence_defaults=evidence_defaults,
+                metrics_defaults=metrics_defaults,
+                eval_suite_id=eval_suite_id,
+                eval_scoring_reference=eval_scoring_reference,
             )
-            unresolved_fields = self._unresolved_fields(merged)
-            filled_patch_path = out_dir / f"patch_overrides_filled_{self._safe_name(baseline_id)}.json"
-            filled_patch_path.write_text(json.dumps(merged, indent=2, ensure_ascii=True), encoding="utf-8")
+            unresolved_fields = patch_fields.unresolved_fields(merged)
+            safe_baseline_name = self._safe_name(baseline_id)
+            filled_patch_path = out_dir / f"patch_overrides_filled_{safe_baseline_name}.json"
+            pending_writes[filled_patch_path] = merged
 
             align_to_eval = bool(baseline_entry.get("align_to_eval", defaults.get("align_to_eval", True)))
             replace_metrics = bool(
@@ -91,6 +145,7 @@ class ExternalClaimCampaignAutofillService:
                 "max_metric_delta": max_metric_delta,
             }
             if unresolved_fields:
+                unresolved_baseline_ids.add(baseline_id)
                 unresolved_baselines.append(
                     {
                         "baseline_id": baseline_id,
@@ -106,19 +161,27 @@ class ExternalClaimCampaignAutofillService:
                     "resolved": len(unresolved_fields) == 0,
                 }
             )
+            if not unresolved_fields:
+                resolved_baselines += 1
 
             ingest_payload_result = self._build_inline_ingest_payload(
                 baseline_id=baseline_id,
                 baseline_entry=baseline_entry,
                 defaults=defaults,
+                ingest_defaults=ingest_defaults,
+                ingest_evidence_defaults=ingest_evidence_defaults,
+                ingest_metrics_defaults=ingest_metrics_defaults,
                 merged_patch=merged,
-                eval_report=eval_report,
+                eval_suite_id=eval_suite_id,
+                eval_scoring_reference=eval_scoring_reference,
                 output_dir=out_dir,
+                safe_baseline_name=safe_baseline_name,
             )
             ingest_status = str(ingest_payload_result.get("status", "skip"))
             if ingest_status == "ok":
                 ingest_payload_path = str(ingest_payload_result.get("ingest_payload_path", "")).strip()
                 if ingest_payload_path:
+                    pending_writes[Path(ingest_payload_path)] = ingest_payload_result["ingest_payload"]
                     generated_ingest_paths.append(ingest_payload_path)
                     generated_ingest_payloads.append(
                         {
@@ -127,7 +190,9 @@ class ExternalClaimCampaignAutofillService:
                             "resolved": True,
                         }
                     )
+                    generated_resolved_count += 1
             elif ingest_status == "error":
+                unresolved_baseline_ids.add(baseline_id)
                 unresolved_baselines.append(
                     {
                         "baseline_id": baseline_id,
@@ -154,19 +219,13 @@ class ExternalClaimCampaignAutofillService:
             generated_paths=generated_ingest_paths,
         )
         patch_map_path = out_dir / "patch_map.autofilled.json"
-        patch_map_path.write_text(json.dumps(filled_patch_map, indent=2, ensure_ascii=True), encoding="utf-8")
+        pending_writes[patch_map_path] = filled_patch_map
         ingest_manifest_path = out_dir / "ingest_manifest.autofilled.json"
-        ingest_manifest_path.write_text(json.dumps(ingest_manifest, indent=2, ensure_ascii=True), encoding="utf-8")
+        pending_writes[ingest_manifest_path] = ingest_manifest
+        self._write_json_batch(list(pending_writes.items()))
 
         total_baselines = len(filled_files)
-        resolved_baselines = sum(1 for row in filled_files if bool(row.get("resolved", False)))
-        unresolved_count = len(
-            {
-                str(row.get("baseline_id", "")).strip()
-                for row in unresolved_baselines
-                if str(row.get("baseline_id", "")).strip()
-            }
-        )
+        unresolved_count = len(unresolved_baseline_ids)
         status = "ok"
         if total_baselines == 0:
             status = "empty"
@@ -185,9 +244,7 @@ class ExternalClaimCampaignAutofillService:
                 "baselines_resolved": resolved_baselines,
                 "baselines_unresolved": unresolved_count,
                 "ingest_payload_paths": len(ingest_manifest),
-                "generated_ingest_payloads": len(
-                    [row for row in generated_ingest_payloads if bool(row.get("resolved", False))]
-                ),
+                "generated_ingest_payloads": generated_resolved_count,
             },
             "filled_files": filled_files,
             "generated_ingest_payloads": generated_ingest_payloads,
@@ -204,17 +261,20 @@ class ExternalClaimCampaignAutofillService:
         base_patch: dict[str, Any],
         baseline_entry: dict[str, Any],
         defaults: dict[str, Any],
-        eval_report: dict[str, Any],
+        evidence_defaults: dict[str, Any],
+        metrics_defaults: dict[str, Any],
+        eval_suite_id: Any,
+        eval_scoring_reference: Any,
     ) -> dict[str, Any]:
         merged = dict(base_patch)
-        source = self._pick_value(
+        source = _pick_value(
             baseline_entry.get("source"),
             defaults.get("source"),
             merged.get("source"),
         )
         if source is not None:
             merged["source"] = source
-        source_date = self._pick_value(
+        source_date = _pick_value(
             baseline_entry.get("source_date"),
             defaults.get("source_date"),
             merged.get("source_date"),
@@ -222,30 +282,27 @@ class ExternalClaimCampaignAutofillService:
         if source_date is not None:
             merged["source_date"] = source_date
 
+        # Nested blocks are copied before filling so a scaffold patch shared by several rows stays pristine.
         evidence = merged.get("evidence", {})
-        if not isinstance(evidence, dict):
-            evidence = {}
+        evidence = dict(evidence) if isinstance(evidence, dict) else {}
         evidence_entry = baseline_entry.get("evidence", {})
         if not isinstance(evidence_entry, dict):
             evidence_entry = {}
-        evidence_defaults = defaults.get("evidence", {})
-        if not isinstance(evidence_defaults, dict):
-            evidence_defaults = {}
-        citation = self._pick_value(
+        citation = _pick_value(
             evidence_entry.get("citation"),
             baseline_entry.get("citation"),
             evidence_defaults.get("citation"),
             defaults.get("citation"),
             evidence.get("citation"),
         )
-        retrieval_date = self._pick_value(
+        retrieval_date = _pick_value(
             evidence_entry.get("retrieval_date"),
             baseline_entry.get("retrieval_date"),
             evidence_defaults.get("retrieval_date"),
             defaults.get("retrieval_date"),
             evidence.get("retrieval_date"),
         )
-        verification_method = self._pick_value(
+        verification_method = _pick_value(
             evidence_entry.get("verification_method"),
             baseline_entry.get("verification_method"),
             evidence_defaults.get("verification_method"),
@@ -262,16 +319,12 @@ class ExternalClaimCampaignAutofillService:
             merged["evidence"] = evidence
 
         metrics = merged.get("metrics", {})
-        if not isinstance(metrics, dict):
-            metrics = {}
+        metrics = dict(metrics) if isinstance(metrics, dict) else {}
         metrics_entry = baseline_entry.get("metrics", {})
         if not isinstance(metrics_entry, dict):
             metrics_entry = {}
-        metrics_defaults = defaults.get("metrics", {})
-        if not isinstance(metrics_defaults, dict):
-            metrics_defaults = {}
         for key, value in metrics_defaults.items():
-            if key not in metrics or self._is_missing(metrics.get(key)):
+            if key not in metrics or _is_missing(metrics.get(key)):
                 metrics[key] = value
         for key, value in metrics_entry.items():
             metrics[key] = value
@@ -280,8 +333,8 @@ class ExternalClaimCampaignAutofillService:
 
         align_to_eval = bool(baseline_entry.get("align_to_eval", defaults.get("align_to_eval", True)))
         if align_to_eval:
-            suite_id = str(eval_report.get("benchmark_progress", {}).get("suite_id", "")).strip()
-            scoring_reference = str(eval_report.get("benchmark_provenance", {}).get("scoring_reference", "")).strip()
+            suite_id = str(eval_suite_id).strip()
+            scoring_reference = str(eval_scoring_reference).strip()
             if suite_id:
                 merged["suite_id"] = suite_id
             if scoring_reference:
@@ -296,27 +349,27 @@ class ExternalClaimCampaignAutofillService:
         generated_paths: list[str],
     ) -> list[str]:
         paths: list[str] = []
-        for raw in explicit_paths:
+        seen: set[str] = set()
+
+        def add(raw: Any) -> None:
             value = str(raw).strip()
-            if value:
+            if value and value not in seen:
+                seen.add(value)
                 paths.append(value)
+
+        for raw in explicit_paths:
+            add(raw)
         for row in baseline_values.values():
             if not isinstance(row, dict):
                 continue
-            single = str(row.get("ingest_payload_path", "")).strip()
-            if single:
-                paths.append(single)
+            add(row.get("ingest_payload_path", ""))
             plural = row.get("ingest_payload_paths", [])
             if isinstance(plural, list):
                 for raw in plural:
-                    item = str(raw).strip()
-                    if item:
-                        paths.append(item)
+                    add(raw)
         for raw in generated_paths:
-            value = str(raw).strip()
-            if value:
-                paths.append(value)
-        return list(dict.fromkeys(paths))
+            add(raw)
+        return paths
 
     def _build_inline_ingest_payload(
         self,
@@ -324,16 +377,18 @@ class ExternalClaimCampaignAutofillService:
         baseline_id: str,
         baseline_entry: dict[str, Any],
         defaults: dict[str, Any],
+        ingest_defaults: dict[str, Any],
+        ingest_evidence_defaults: dict[str, Any],
+        ingest_metrics_defaults: dict[str, Any],
         merged_patch: dict[str, Any],
-        eval_report: dict[str, Any],
+        eval_suite_id: Any,
+        eval_scoring_reference: Any,
         output_dir: Path,
+        safe_baseline_name: str,
     ) -> dict[str, Any]:
         ingest_entry = baseline_entry.get("ingest_payload", {})
         if not isinstance(ingest_entry, dict):
             ingest_entry = {}
-        defaults_ingest = defaults.get("ingest_payload", {})
-        if not isinstance(defaults_ingest, dict):
-            defaults_ingest = {}
         generate_ingest = bool(
             baseline_entry.get(
                 "generate_ingest_payload",
@@ -349,9 +404,6 @@ class ExternalClaimCampaignAutofillService:
         ingest_evidence_entry = ingest_entry.get("evidence", {})
         if not isinstance(ingest_evidence_entry, dict):
             ingest_evidence_entry = {}
-        defaults_evidence_entry = defaults_ingest.get("evidence", {})
-        if not isinstance(defaults_evidence_entry, dict):
-            defaults_evidence_entry = {}
 
         merged_metrics = merged_patch.get("metrics", {})
         if not isinstance(merged_metrics, dict):
@@ -359,100 +411,96 @@ class ExternalClaimCampaignAutofillService:
         ingest_metrics_entry = ingest_entry.get("metrics", {})
         if not isinstance(ingest_metrics_entry, dict):
             ingest_metrics_entry = {}
-        defaults_metrics_entry = defaults_ingest.get("metrics", {})
-        if not isinstance(defaults_metrics_entry, dict):
-            defaults_metrics_entry = {}
-        metrics: dict[str, Any] = {}
-        for key, value in defaults_metrics_entry.items():
-            metrics[str(key)] = value
-        for key, value in merged_metrics.items():
-            metrics[str(key)] = value
-        for key, value in ingest_metrics_entry.items():
-            metrics[str(key)] = value
-
-        suite_id = self._pick_value(
+        # Later sources win; keys stay str()-normalized in case in-process callers pass non-string keys.
+        metrics: dict[str, Any] = {
+            str(key): value
+            for source in (ingest_metrics_defaults, merged_metrics, ingest_metrics_entry)
+            for key, value in source.items()
+        }
+
+        suite_id = _pick_value(
             ingest_entry.get("suite_id"),
-            defaults_ingest.get("suite_id"),
+            ingest_defaults.get("suite_id"),
             merged_patch.get("suite_id"),
-            eval_report.get("benchmark_progress", {}).get("suite_id", ""),
+            eval_suite_id,
         )
-        scoring_protocol = self._pick_value(
+        scoring_protocol = _pick_value(
             ingest_entry.get("scoring_protocol"),
-            defaults_ingest.get("scoring_protocol"),
+            ingest_defaults.get("scoring_protocol"),
             merged_patch.get("scoring_protocol"),
-            eval_report.get("benchmark_provenance", {}).get("scoring_reference", ""),
+            eval_scoring_reference,
         )
 
         ingest_payload: dict[str, Any] = {
-            "baseline_id": self._pick_value(
+            "baseline_id": _pick_value(
                 ingest_entry.get("baseline_id"),
                 baseline_entry.get("ingest_baseline_id"),
                 f"{baseline_id}-autofilled",
             ),
-            "label": self._pick_value(
+            "label": _pick_value(
                 ingest_entry.get("label"),
                 baseline_entry.get("ingest_label"),
                 f"Autofilled {baseline_id}",
             ),
             "source_type": str(
-                self._pick_value(
+                _pick_value(
                     ingest_entry.get("source_type"),
                     baseline_entry.get("source_type"),
-                    defaults_ingest.get("source_type"),
+                    ingest_defaults.get("source_type"),
                     "external_reported",
                 )
             ),
-            "source": self._pick_value(
+            "source": _pick_value(
                 ingest_entry.get("source"),
-                defaults_ingest.get("source"),
+                ingest_defaults.get("source"),
                 merged_patch.get("source"),
             ),
-            "source_date": self._pick_value(
+            "source_date": _pick_value(
                 ingest_entry.get("source_date"),
-                defaults_ingest.get("source_date"),
+                ingest_defaults.get("source_date"),
                 merged_patch.get("source_date"),
             ),
             "verified": bool(
-                ingest_entry.get("verified", baseline_entry.get("verified", defaults_ingest.get("verified", False)))
+                ingest_entry.get("verified", baseline_entry.get("verified", ingest_defaults.get("verified", False)))
             ),
             "enabled": bool(
-                ingest_entry.get("enabled", baseline_entry.get("enabled", defaults_ingest.get("enabled", True)))
+                ingest_entry.get("enabled", baseline_entry.get("enabled", ingest_defaults.get("enabled", True)))
             ),
             "suite_id": suite_id,
             "scoring_protocol": scoring_protocol,
             "evidence": {
-                "citation": self._pick_value(
+                "citation": _pick_value(
                     ingest_evidence_entry.get("citation"),
-                    defaults_evidence_entry.get("citation"),
+                    ingest_evidence_defaults.get("citation"),
                     merged_evidence.get("citation"),
                 ),
-                "artifact_hash": self._pick_value(
+                "artifact_hash": _pick_value(
                     ingest_evidence_entry.get("artifact_hash"),
-                    defaults_evidence_entry.get("artifact_hash"),
+                    ingest_evidence_defaults.get("artifact_hash"),
                     "",
                 ),
-                "retrieval_date": self._pick_value(
+                "retrieval_date": _pick_value(
                     ingest_evidence_entry.get("retrieval_date"),
-                    defaults_evidence_entry.get("retrieval_date"),
+                    ingest_evidence_defaults.get("retrieval_date"),
                     merged_evidence.get("retrieval_date"),
                 ),
-                "verification_method": self._pick_value(
+                "verification_method": _pick_value(
                     ingest_evidence_entry.get("verification_method"),
-                    defaults_evidence_entry.get("verification_method"),
+                    ingest_evidence_defaults.get("verification_method"),
                     merged_evidence.get("verification_method"),
                 ),
-                "replication_status": self._pick_value(
+                "replication_status": _pick_value(
                     ingest_evidence_entry.get("replication_status"),
-                    defaults_evidence_entry.get("replication_status"),
+                    ingest_evidence_defaults.get("replication_status"),
                     "pending",
                 ),
             },
             "metrics": metrics,
             "notes": str(
-                self._pick_value(
+                _pick_value(
                     ingest_entry.get("notes"),
                     baseline_entry.get("ingest_notes"),
-                    defaults_ingest.get("notes"),
+                    ingest_defaults.get("notes"),
                     "",
                 )
             ),
@@ -465,27 +513,21 @@ class ExternalClaimCampaignAutofillService:
                 "unresolved_fields": unresolved_fields,
             }
         payload_baseline_id = str(ingest_payload.get("baseline_id", baseline_id)).strip() or baseline_id
-        out_path = output_dir / f"ingest_payload_autofilled_{self._safe_name(payload_baseline_id)}.json"
-        out_path.write_text(json.dumps(ingest_payload, indent=2, ensure_ascii=True), encoding="utf-8")
+        if payload_baseline_id != baseline_id:
+            safe_baseline_name = self._safe_name(payload_baseline_id)
+        out_path = output_dir / f"ingest_payload_autofilled_{safe_baseline_name}.json"
+        # The caller writes the payload together with the other autofill outputs.
         return {
             "status": "ok",
             "ingest_payload_path": str(out_path),
+            "ingest_payload": ingest_payload,
         }
 
     def _validate_inline_ingest_payload(self, payload: dict[str, Any]) -> list[str]:
         unresolved: list[str] = []
-        required_fields = (
-            "baseline_id",
-            "label",
-            "source_type",
-            "source",
-            "source_date",
-            "suite_id",
-            "scoring_protocol",
-        )
-        for field in required_fields:
+        for field in self._REQUIRED_INGEST_FIELDS:
             value = payload.get(field)
-            if self._is_missing(value):
+            if _is_missing(value):
                 unresolved.append(field)
         source_type = str(payload.get("source_type", "")).strip().lower()
         if source_type and not source_type.startswith("external"):
@@ -501,20 +543,21 @@ class ExternalClaimCampaignAutofillService:
         if not isinstance(evidence, dict):
             unresolved.append("evidence (must be object)")
             evidence = {}
+        # Each evidence value is stripped once; an empty result is missing, so the checks below see non-empty text.
         citation = str(evidence.get("citation", "")).strip()
         retrieval_date = str(evidence.get("retrieval_date", "")).strip()
         verification_method = str(evidence.get("verification_method", "")).strip()
-        if self._is_missing(citation):
+        if not citation:
             unresolved.append("evidence.citation")
-        elif self._contains_placeholder_token(citation):
+        elif self._PLACEHOLDER_RE.search(citation.lower()) is not None:
             unresolved.append("evidence.citation (placeholder token)")
-        if self._is_missing(retrieval_date):
+        if not retrieval_date:
             unresolved.append("evidence.retrieval_date")
         elif not self._is_iso_date(retrieval_date):
             unresolved.append("evidence.retrieval_date (invalid iso date)")
-        if self._is_missing(verification_method):
+        if not verification_method:
             unresolved.append("evidence.verification_method")
-        elif self._contains_placeholder_token(verification_method):
+        elif self._PLACEHOLDER_RE.search(verification_method.lower()) is not None:
             unresolved.append("evidence.verification_method (placeholder token)")
 
         metrics = payload.get("metrics", {})
@@ -522,70 +565,88 @@ class ExternalClaimCampaignAutofillService:
             unresolved.append("metrics")
         else:
             for key, value in metrics.items():
-                if self._is_missing(value):
+                if _is_missing(value):
                     unresolved.append(f"metrics.{key}")
                     continue
+                # float(True) would pass, so booleans are rejected before the numeric fast path.
+                if isinstance(value, bool):
+                    unresolved.append(f"metrics.{key} (non-numeric)")
+                    continue
+                if isinstance(value, (int, float)):
+                    continue
                 try:
                     float(value)
                 except (TypeError, ValueError):
                     unresolved.append(f"metrics.{key} (non-numeric)")
         return sorted(dict.fromkeys(unresolved))
 
+    def _write_json_batch(self, items: list[tuple[Path, Any]]) -> None:
+        """Write every queued output once, concurrently when there is more than one."""
+        if len(items) <= 1:
+            for path, payload in items:
+                self._write_json(path, payload)
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+            # list() drains the iterator so the first failed write is re-raised here.
+            list(executor.map(lambda item: self._write_json(*item), items))
+
+    def _write_json(self, path: Path, payload: Any) -> None:
+        # ensure_ascii output is already ASCII bytes; unchanged files keep their mtime for stat-keyed readers.
+        replace_file_if_changed(path, json.dumps(payload, indent=2, ensure_ascii=True).encode("ascii"))
+
+    def _object_field(self, payload: dict[str, Any], key: str) -> dict[str, Any]:
+        value = payload.get(key, {})
+        return value if isinstance(value, dict) else {}
+
+    def _load_json_objects(self, paths: list[str]) -> list[dict[str, Any]]:
+        """
+        Load each distinct path once, concurrently, and hand rows that share a path the same result.
+        Callers must treat the returned payloads as read-only.
+        """
+        keys = [os.path.abspath(path) for path in paths]
+        # The first spelling of each path is the one loaded, so error messages still quote it.
+        first_paths: dict[str, str] = {}
+        for key, path in zip(keys, paths):
+            first_paths.setdefault(key, path)
+        unique_paths = list(first_paths.values())
+        if len(unique_paths) <= 1:
+            loaded = [self._load_json_object(path=path) for path in unique_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(unique_paths))) as executor:
+                loaded = list(executor.map(lambda path: self._load_json_object(path=path), unique_paths))
+        by_key = dict(zip(first_paths, loaded))
+        return [by_key[key] for key in keys]
+
     def _load_json_object(self, *, path: str) -> dict[str, Any]:
         payload_path = Path(path)
-        if not payload_path.exists():
-            return {"status": "error", "reason": f"file not found: {payload_path}"}
         try:
-            payload = json.loads(payload_path.read_text(encoding="utf-8"))
+            payload = json.loads(payload_path.read_bytes())
+        except FileNotFoundError:
+            return {"status": "error", "reason": f"file not found: {payload_path}"}
         except json.JSONDecodeError as exc:
             return {"status": "error", "reason": f"invalid json: {exc}"}
         if not isinstance(payload, dict):
             return {"status": "error", "reason": "payload must be an object"}
         return {"status": "ok", "payload": payload}
 
-    def _pick_value(self, *values: Any) -> Any:
-        for value in values:
-            if self._is_missing(value):
-                continue
-            return value
-        return None
-
-    def _is_missing(self, value: Any) -> bool:
-        if value is None:
-            return True
-        if isinstance(value, str):
-            return not value.strip()
-        return False
 
     def _contains_placeholder_token(self, value: str) -> bool:
         normalized = value.strip().lower()
         if not normalized:
             return True
-        return any(token in normalized for token in self._PLACEHOLDER_TOKENS)
+        return self._PLACEHOLDER_RE.search(normalized) is not None
 
     def _is_iso_date(self, value: str) -> bool:
         payload = value.strip()
-        if not payload:
+        # Only YYYY-MM-DD is accepted, so anything else is rejected before the parser runs.
+        if len(payload) != 10:
             return False
         try:
             datetime.fromisoformat(payload)
-            return len(payload) == 10
+            return True
         except ValueError:
             return False
 
-    def _unresolved_fields(self, payload: Any, prefix: str = "") -> list[str]:
-        unresolved: list[str] = []
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                unresolved.extend(self._unresolved_fields(value, name))
-            return unresolved
-        if payload is None:
-            return [prefix] if prefix else []
-        if isinstance(payload, str) and not payload.strip():
-            return [prefix] if prefix else []
-        return []
-
     def _safe_name(self, value: str) -> str:
-        normalized = re.sub(r"[^A-Za-z0-9._-]+", "_", value.strip())
+        normalized = self._SAFE_NAME_RE.sub("_", value.strip())
         return normalized or "baseline"
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from . import patch_fields
 
 
 class ExternalClaimCampaignDraftService:
-    _MANUAL_PATCH_ACTIONS = {
-        "refresh_evidence_payload",
-        "replace_placeholder_metadata",
-        "normalize_metadata_dates",
-        "normalize_harness_alignment",
-        "add_overlapping_metrics",
-        "increase_metric_overlap",
-    }
+    _MANUAL_PATCH_ACTIONS = frozenset(
+        (
+            "refresh_evidence_payload",
+            "replace_placeholder_metadata",
+            "normalize_metadata_dates",
+            "normalize_harness_alignment",
+            "add_overlapping_metrics",
+            "increase_metric_overlap",
+        )
+    )
+    _MANUAL_PATCH_ACTIONS_ORDERED = tuple(sorted(_MANUAL_PATCH_ACTIONS))
 
     def build(
         self,
@@ -35,37 +41,53 @@ class ExternalClaimCampaignDraftService:
         patch_map = patch_overrides_map if isinstance(patch_overrides_map, dict) else {}
         ingest_paths = ingest_payload_paths if isinstance(ingest_payload_paths, list) else []
 
-        baseline_runs: list[dict[str, Any]] = []
-        unresolved_dependencies: list[dict[str, Any]] = []
-        staged_rows = 0
+        staged: list[tuple[str, list[Any], bool]] = []
         for row in row_plans:
             if not isinstance(row, dict):
                 continue
             baseline_id = str(row.get("baseline_id", "")).strip()
             if not baseline_id:
                 continue
-            staged_rows += 1
             actions = row.get("actions", [])
             if not isinstance(actions, list):
                 actions = []
-            action_types = {
-                str(action.get("action_type", "")).strip()
-                for action in actions
-                if isinstance(action, dict)
-            }
-            requires_patch = len(action_types & self._MANUAL_PATCH_ACTIONS) > 0
+            # Stops at the first manual patch action; the full action set is only built for error reporting.
+            requires_patch = any(
+                action_type in self._MANUAL_PATCH_ACTIONS for action_type in self._action_types(actions)
+            )
+            staged.append((baseline_id, actions, requires_patch))
+
+        # Every patch and ingest file is read in one stage up front, so a path shared by several rows is loaded once.
+        load_paths = [
+            self._patch_path(patch_map.get(baseline_id))
+            for baseline_id, _, requires_patch in staged
+            if requires_patch
+        ]
+        load_paths.extend(str(raw_path).strip() for raw_path in ingest_paths)
+        loaded = self._load_json_objects([path for path in load_paths if path])
+
+        baseline_runs: list[dict[str, Any]] = []
+        unresolved_dependencies: list[dict[str, Any]] = []
+        staged_rows = len(staged)
+        for baseline_id, actions, requires_patch in staged:
             if requires_patch:
                 resolved = self._resolve_patch_step(
                     baseline_id=baseline_id,
                     entry=patch_map.get(baseline_id),
                     default_max_metric_delta=default_max_metric_delta,
+                    loaded=loaded,
                 )
                 if resolved.get("status") != "ok":
+                    action_types = set(self._action_types(actions))
                     unresolved_dependencies.append(
                         {
                             "baseline_id": baseline_id,
                             "reason": str(resolved.get("reason", "unable to resolve patch overrides")),
-                            "requires_actions": sorted(action_types & self._MANUAL_PATCH_ACTIONS),
+                            "requires_actions": [
+                                action_type
+                                for action_type in self._MANUAL_PATCH_ACTIONS_ORDERED
+                                if action_type in action_types
+                            ],
                         }
                     )
                     continue
@@ -74,7 +96,7 @@ class ExternalClaimCampaignDraftService:
                     baseline_runs.append(step)
                 continue
 
-            if "attest_baseline" in action_types:
+            if any(action_type == "attest_baseline" for action_type in self._action_types(actions)):
                 baseline_runs.append(
                     {
                         "baseline_id": baseline_id,
@@ -84,7 +106,7 @@ class ExternalClaimCampaignDraftService:
                     }
                 )
 
-        ingest_stage = self._validate_ingest_paths(ingest_paths=ingest_paths)
+        ingest_stage = self._validate_ingest_paths(ingest_paths=ingest_paths, loaded=loaded)
         status = "ok"
         if unresolved_dependencies and (baseline_runs or ingest_stage["ingest_payload_paths"]):
             status = "partial"
@@ -120,41 +142,39 @@ class ExternalClaimCampaignDraftService:
         baseline_id: str,
         entry: Any,
         default_max_metric_delta: float,
+        loaded: dict[str, dict[str, Any]],
     ) -> dict[str, Any]:
         if entry is None:
             return {"status": "error", "reason": "missing patch_overrides mapping for baseline"}
 
-        patch_path = ""
+        if not isinstance(entry, (str, dict)):
+            return {
+                "status": "error",
+                "reason": "patch_overrides entry must be a path string or object",
+            }
         align_to_eval = True
         replace_metrics = False
         max_metric_delta = float(default_max_metric_delta)
-        if isinstance(entry, str):
-            patch_path = entry
-        elif isinstance(entry, dict):
-            patch_path = str(entry.get("patch_overrides_path", "")).strip()
+        if isinstance(entry, dict):
             align_to_eval = bool(entry.get("align_to_eval", True))
             replace_metrics = bool(entry.get("replace_metrics", False))
             max_metric_delta = float(entry.get("max_metric_delta", default_max_metric_delta))
-        else:
-            return {
-                "status": "error",
-                "reason": "patch_overrides entry must be a path string or object",
-            }
 
+        patch_path = self._patch_path(entry)
         if not patch_path:
             return {
                 "status": "error",
                 "reason": "patch_overrides_path is required",
             }
 
-        payload = self._load_json_object(path=patch_path)
+        payload = loaded[patch_path]
         if payload.get("status") != "ok":
             return payload
         patch_obj = payload.get("payload", {})
         if not isinstance(patch_obj, dict):
             return {"status": "error", "reason": "patch overrides payload must be an object"}
 
-        unresolved_fields = self._unresolved_fields(patch_obj)
+        unresolved_fields = patch_fields.unresolved_fields(patch_obj)
         if unresolved_fields:
             return {
                 "status": "error",
@@ -175,23 +195,29 @@ class ExternalClaimCampaignDraftService:
             },
         }
 
-    def _validate_ingest_paths(self, *, ingest_paths: list[str]) -> dict[str, Any]:
+    def _validate_ingest_paths(
+        self,
+        *,
+        ingest_paths: list[str],
+        loaded: dict[str, dict[str, Any]],
+    ) -> dict[str, Any]:
         ready: list[str] = []
+        seen: set[str] = set()
         errors: list[dict[str, str]] = []
         for raw_path in ingest_paths:
             path = str(raw_path).strip()
             if not path:
                 continue
-            loaded = self._load_json_object(path=path)
-            if loaded.get("status") != "ok":
+            load_result = loaded[path]
+            if load_result.get("status") != "ok":
                 errors.append(
                     {
                         "payload_path": path,
-                        "reason": str(loaded.get("reason", "invalid ingest payload")),
+                        "reason": str(load_result.get("reason", "invalid ingest payload")),
                     }
                 )
                 continue
-            payload = loaded.get("payload", {})
+            payload = load_result.get("payload", {})
             baseline_id = str(payload.get("baseline_id", "")).strip() if isinstance(payload, dict) else ""
             if not baseline_id:
                 errors.append(
@@ -201,31 +227,44 @@ class ExternalClaimCampaignDraftService:
                     }
                 )
                 continue
-            ready.append(str(Path(path)))
-        deduped = list(dict.fromkeys(ready))
-        return {"ingest_payload_paths": deduped, "errors": errors}
+            normalized = str(Path(path))
+            if normalized not in seen:
+                seen.add(normalized)
+                ready.append(normalized)
+        return {"ingest_payload_paths": ready, "errors": errors}
+
+    @staticmethod
+    def _action_types(actions: list[Any]) -> Iterator[str]:
+        for action in actions:
+            if isinstance(action, dict):
+                yield str(action.get("action_type", "")).strip()
+
+    @staticmethod
+    def _patch_path(entry: Any) -> str:
+        if isinstance(entry, str):
+            return entry
+        if isinstance(entry, dict):
+            return str(entry.get("patch_overrides_path", "")).strip()
+        return ""
+
+    def _load_json_objects(self, paths: list[str]) -> dict[str, dict[str, Any]]:
+        """Load each distinct path once, concurrently; callers must treat the returned payloads as read-only."""
+        unique_paths = list(dict.fromkeys(paths))
+        if len(unique_paths) <= 1:
+            loaded = [self._load_json_object(path=path) for path in unique_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(unique_paths))) as executor:
+                loaded = list(executor.map(lambda path: self._load_json_object(path=path), unique_paths))
+        return dict(zip(unique_paths, loaded))
 
     def _load_json_object(self, *, path: str) -> dict[str, Any]:
         payload_path = Path(path)
-        if not payload_path.exists():
-            return {"status": "error", "reason": f"file not found: {payload_path}"}
         try:
-            payload = json.loads(payload_path.read_text(encoding="utf-8"))
+            payload = json.loads(payload_path.read_bytes())
+        except FileNotFoundError:
+            return {"status": "error", "reason": f"file not found: {payload_path}"}
         except json.JSONDecodeError as exc:
             return {"status": "error", "reason": f"invalid json: {exc}"}
         if not isinstance(payload, dict):
             return {"status": "error", "reason": "payload must be an object"}
         return {"status": "ok", "payload": payload}
-
-    def _unresolved_fields(self, payload: Any, prefix: str = "") -> list[str]:
-        unresolved: list[str] = []
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                unresolved.extend(self._unresolved_fields(value, name))
-            return unresolved
-        if payload is None:
-            return [prefix] if prefix else []
-        if isinstance(payload, str) and not payload.strip():
-            return [prefix] if prefix else []
-        return []
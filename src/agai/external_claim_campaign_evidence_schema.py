@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from . import patch_fields
+
 
 class ExternalClaimCampaignEvidenceSchemaService:
     def build(
@@ -64,7 +66,7 @@ class ExternalClaimCampaignEvidenceSchemaService:
 
             patch_template = load_result["payload"]
             normalized_template = self._normalize_template(patch_template)
-            unresolved_fields = self._unresolved_fields(normalized_template)
+            unresolved_fields = patch_fields.unresolved_fields(normalized_template)
             baseline_entry: dict[str, Any] = dict(normalized_template)
             baseline_entry["align_to_eval"] = True
             baseline_entry["replace_metrics"] = False
@@ -160,19 +162,6 @@ class ExternalClaimCampaignEvidenceSchemaService:
             return {"status": "error", "reason": "payload must be an object"}
         return {"status": "ok", "payload": payload}
 
-    def _unresolved_fields(self, payload: Any, prefix: str = "") -> list[str]:
-        unresolved: list[str] = []
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                unresolved.extend(self._unresolved_fields(value, name))
-            return unresolved
-        if payload is None:
-            return [prefix] if prefix else []
-        if isinstance(payload, str) and not payload.strip():
-            return [prefix] if prefix else []
-        return []
-
     def _build_ingest_template(
         self,
         *,
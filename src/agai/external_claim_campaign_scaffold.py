@@ -5,6 +5,7 @@ import re
 from pathlib import Path
 from typing import Any
 
+from . import patch_fields
 from .baseline_patch_template import ExternalBaselinePatchTemplateService
 
 
@@ -17,6 +18,7 @@ class ExternalClaimCampaignScaffoldService:
         "add_overlapping_metrics",
         "increase_metric_overlap",
     }
+    _SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
 
     def build(
         self,
@@ -82,7 +84,7 @@ class ExternalClaimCampaignScaffoldService:
             file_name = f"patch_overrides_{self._safe_name(baseline_id)}.json"
             patch_path = out_dir / file_name
             patch_path.write_text(json.dumps(patch_payload, indent=2, ensure_ascii=True), encoding="utf-8")
-            unresolved_fields = self._unresolved_fields(patch_payload)
+            unresolved_fields = patch_fields.unresolved_fields(patch_payload)
             patch_map[baseline_id] = {
                 "patch_overrides_path": str(patch_path),
                 "align_to_eval": True,
@@ -137,18 +139,5 @@ class ExternalClaimCampaignScaffoldService:
         }
 
     def _safe_name(self, value: str) -> str:
-        normalized = re.sub(r"[^A-Za-z0-9._-]+", "_", value.strip())
+        normalized = self._SAFE_NAME_RE.sub("_", value.strip())
         return normalized or "baseline"
-
-    def _unresolved_fields(self, payload: Any, prefix: str = "") -> list[str]:
-        unresolved: list[str] = []
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                unresolved.extend(self._unresolved_fields(value, name))
-            return unresolved
-        if payload is None:
-            return [prefix] if prefix else []
-        if isinstance(payload, str) and not payload.strip():
-            return [prefix] if prefix else []
-        return []
@@ -7,6 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from . import patch_fields
 from .baseline_ingestion import ExternalBaselineIngestionService
 
 
@@ -165,7 +166,7 @@ class ExternalClaimCampaignValidatorService:
             ]
         patch = load_result["payload"]
 
-        unresolved = self._unresolved_fields(patch)
+        unresolved = patch_fields.unresolved_fields(patch)
         for field in unresolved:
             issues.append(
                 self._issue(
@@ -396,29 +397,16 @@ class ExternalClaimCampaignValidatorService:
 
     def _load_json_object(self, *, path: str) -> dict[str, Any]:
         payload_path = Path(path)
-        if not payload_path.exists():
-            return {"status": "error", "reason": f"file not found: {payload_path}"}
         try:
-            payload = json.loads(payload_path.read_text(encoding="utf-8"))
+            payload = json.loads(payload_path.read_bytes())
+        except FileNotFoundError:
+            return {"status": "error", "reason": f"file not found: {payload_path}"}
         except json.JSONDecodeError as exc:
             return {"status": "error", "reason": f"invalid json: {exc}"}
         if not isinstance(payload, dict):
             return {"status": "error", "reason": "payload must be an object"}
         return {"status": "ok", "payload": payload}
 
-    def _unresolved_fields(self, payload: Any, prefix: str = "") -> list[str]:
-        unresolved: list[str] = []
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                unresolved.extend(self._unresolved_fields(value, name))
-            return unresolved
-        if payload is None:
-            return [prefix] if prefix else []
-        if isinstance(payload, str) and not payload.strip():
-            return [prefix] if prefix else []
-        return []
-
     def _contains_placeholder_token(self, value: str) -> bool:
         tokens = ["unknown", "pending", "placeholder", "tbd"]
         normalized = value.strip().lower()
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import copy
-import hashlib
 import json
 import tempfile
 from pathlib import Path
 from typing import Any
 
+from . import patch_fields
 from .baseline_attestation import ExternalBaselineAttestationService
 from .baseline_ingestion import ExternalBaselineIngestionService
 from .baseline_normalization import ExternalBaselineNormalizationService
@@ -14,6 +13,7 @@ from .baseline_patch_template import ExternalBaselinePatchTemplateService
 from .direction_tracker import DirectionTracker
 from .external_claim_campaign import ExternalClaimSandboxCampaignRunner
 from .external_claim_replay import ExternalClaimReplayRunner
+from .file_hashing import sha256_file
 
 
 class ExternalClaimPromotionService:
@@ -42,7 +42,7 @@ class ExternalClaimPromotionService:
                 "reason": f"source registry not found: {source_path}",
                 "source_registry_path": str(source_path),
             }
-        source_hash = self._sha256(source_path)
+        source_hash = sha256_file(source_path)
         before = self._distance_snapshot(
             eval_report=eval_report,
             registry_path=str(source_path),
@@ -127,7 +127,7 @@ class ExternalClaimPromotionService:
                 "reason": f"source registry not found: {source_path}",
                 "source_registry_path": str(source_path),
             }
-        current_hash = self._sha256(source_path)
+        current_hash = sha256_file(source_path)
         if not confirmation_hash.strip():
             return {
                 "status": "error",
@@ -225,7 +225,7 @@ class ExternalClaimPromotionService:
             registry_path=str(source_path),
             max_metric_delta=default_max_metric_delta,
         )
-        source_hash_after = self._sha256(source_path)
+        source_hash_after = sha256_file(source_path)
         source_registry_mutated = bool(source_hash_after != current_hash)
         status = "ok" if execution_status == "ok" and not rollback_applied else "error"
         if rollback_applied and execution_error:
@@ -385,8 +385,8 @@ class ExternalClaimPromotionService:
             override_payload = overrides.get("payload", {})
             if not isinstance(override_payload, dict):
                 override_payload = {}
-            effective_patch = self._deep_merge(copy.deepcopy(patch_template), override_payload)
-            unresolved_fields = self._unresolved_fields(effective_patch)
+            effective_patch = self._deep_merge(dict(patch_template), override_payload)
+            unresolved_fields = patch_fields.unresolved_fields(effective_patch)
             if unresolved_fields:
                 rows.append(
                     {
@@ -712,10 +712,10 @@ class ExternalClaimPromotionService:
         if not path.strip():
             return {"status": "ok", "payload": {}}
         payload_path = Path(path)
-        if not payload_path.exists():
-            return {"status": "error", "reason": f"patch overrides file not found: {payload_path}"}
         try:
-            payload = json.loads(payload_path.read_text(encoding="utf-8"))
+            payload = json.loads(payload_path.read_bytes())
+        except FileNotFoundError:
+            return {"status": "error", "reason": f"patch overrides file not found: {payload_path}"}
         except json.JSONDecodeError as exc:
             return {"status": "error", "reason": f"invalid json in patch overrides: {exc}"}
         if not isinstance(payload, dict):
@@ -729,19 +729,3 @@ class ExternalClaimPromotionService:
             else:
                 base[key] = value
         return base
-
-    def _unresolved_fields(self, payload: Any, prefix: str = "") -> list[str]:
-        unresolved: list[str] = []
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                unresolved.extend(self._unresolved_fields(value, name))
-            return unresolved
-        if payload is None:
-            return [prefix] if prefix else []
-        if isinstance(payload, str) and not payload.strip():
-            return [prefix] if prefix else []
-        return []
-
-    def _sha256(self, path: Path) -> str:
-        return hashlib.sha256(path.read_bytes()).hexdigest()
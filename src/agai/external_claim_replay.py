@@ -66,12 +66,13 @@ class ExternalClaimReplayRunner:
                 registry_path=registry_path,
                 policy_path=self.policy_path,
             )
-            for baseline_id in candidates:
-                result = service.attest_from_eval_report(
-                    baseline_id=baseline_id,
-                    eval_report=eval_before,
-                    max_metric_delta=max_metric_delta,
-                )
+            # One batch loads the policy and registry once and writes the registry once for all candidates.
+            batch = service.attest_batch(
+                baseline_ids=candidates,
+                eval_report=eval_before,
+                max_metric_delta=max_metric_delta,
+            )
+            for baseline_id, result in zip(candidates, batch["results"]):
                 attestation_passed = bool(result.get("attestation_passed", False))
                 if attestation_passed:
                     passed += 1
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import copy
-import hashlib
 import json
 import shutil
 from pathlib import Path
 from typing import Any
 
+from . import patch_fields
 from .baseline_normalization import ExternalBaselineNormalizationService
 from .baseline_patch_template import ExternalBaselinePatchTemplateService
 from .external_claim_replay import ExternalClaimReplayRunner
+from .file_hashing import sha256_file
 
 
 class ExternalClaimSandboxPipeline:
@@ -54,7 +54,7 @@ class ExternalClaimSandboxPipeline:
                 "source_registry_path": str(source_path),
             }
 
-        source_hash_before = self._sha256(source_path)
+        source_hash_before = sha256_file(source_path)
         sandbox_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source_path, sandbox_path)
 
@@ -70,17 +70,17 @@ class ExternalClaimSandboxPipeline:
                 "baseline_id": baseline_id,
                 "source_registry_path": str(source_path),
                 "sandbox_registry_path": str(sandbox_path),
-                "source_registry_unchanged": self._sha256(source_path) == source_hash_before,
+                "source_registry_unchanged": sha256_file(source_path) == source_hash_before,
             }
 
         patch_template = template.get("patch_template", {})
         if not isinstance(patch_template, dict):
             patch_template = {}
         effective_patch = self._deep_merge(
-            copy.deepcopy(patch_template),
+            dict(patch_template),
             patch_overrides if isinstance(patch_overrides, dict) else {},
         )
-        unresolved_fields = self._unresolved_fields(effective_patch)
+        unresolved_fields = patch_fields.unresolved_fields(effective_patch)
 
         before_replay = self.replay.run(
             eval_report=eval_report,
@@ -121,7 +121,7 @@ class ExternalClaimSandboxPipeline:
                 status = "ok" if replay_result.get("status") == "ok" else "error"
 
         after_replay = replay_result if replay_result is not None else before_replay
-        source_hash_after = self._sha256(source_path)
+        source_hash_after = sha256_file(source_path)
         return {
             "status": status,
             "baseline_id": baseline_id,
@@ -193,19 +193,3 @@ class ExternalClaimSandboxPipeline:
             else:
                 base[key] = value
         return base
-
-    def _unresolved_fields(self, payload: Any, prefix: str = "") -> list[str]:
-        unresolved: list[str] = []
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                name = f"{prefix}.{key}" if prefix else str(key)
-                unresolved.extend(self._unresolved_fields(value, name))
-            return unresolved
-        if payload is None:
-            return [prefix] if prefix else []
-        if isinstance(payload, str) and not payload.strip():
-            return [prefix] if prefix else []
-        return []
-
-    def _sha256(self, path: Path) -> str:
-        return hashlib.sha256(path.read_bytes()).hexdigest()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+# A file rewritten within the filesystem timestamp granularity can keep both its mtime and size,
+# so files modified more recently than this window are always re-read instead of served from cache.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def load_json_cached(path: str | Path) -> Any:
+    """
+    Parse a JSON file, reusing the previous parse while its (mtime_ns, size) is unchanged.
+    The returned object is shared between callers and must be treated as read-only.
+    Raises the same OSError / json.JSONDecodeError as an uncached read.
+    """
+    path_str = os.path.abspath(path)
+    stat = os.stat(path_str)
+    if time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS:
+        return _parse(path_str)
+    return _parse_cached(path_str, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_json_cache() -> None:
+    _parse_cached.cache_clear()
+
+
+def replace_file_if_changed(path: str | Path, data: bytes) -> bool:
+    """
+    Atomically replace `path` with `data` unless it already holds exactly those bytes.
+    Skipping identical writes keeps the file's mtime, and with it any cached parse, intact.
+    Returns True when the file was written.
+    """
+    target = Path(path)
+    try:
+        if target.stat().st_size == len(data) and target.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        try:
+            _write_bytes(tmp_path, data)
+        except FileNotFoundError:
+            # The parent directory is only created on demand, which spares a mkdir on every write.
+            target.parent.mkdir(parents=True, exist_ok=True)
+            _write_bytes(tmp_path, data)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    # A raw descriptor writes the buffer directly, without the buffered-file setup of Path.write_bytes.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _parse(path_str: str) -> Any:
+    with open(path_str, "rb") as handle:
+        return json.loads(handle.read())
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    return _parse(path_str)
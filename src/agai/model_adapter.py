@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import threading
 import time
 from collections import Counter
 from typing import Any
@@ -12,11 +13,22 @@ class BaseModelAdapter:
     """
     Base helper for lightweight adapters.
     Provides deterministic lexical scoring and cost accounting helpers.
+    The last cost is tracked per thread, so generate() followed by cost_meter() stays paired
+    when one adapter serves several concurrent callers.
     """
 
     def __init__(self, model_name: str) -> None:
         self.model_name = model_name
-        self._last_cost = CostMeter()
+        self._cost_local = threading.local()
+
+    @property
+    def _last_cost(self) -> CostMeter:
+        cost = getattr(self._cost_local, "cost", None)
+        return cost if cost is not None else CostMeter()
+
+    @_last_cost.setter
+    def _last_cost(self, value: CostMeter) -> None:
+        self._cost_local.cost = value
 
     def _estimate_tokens(self, text: str) -> int:
         return max(1, len(text.split()))
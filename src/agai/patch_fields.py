@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def unresolved_fields(payload: Any, prefix: str = "") -> list[str]:
+    """
+    Dotted paths of every None or blank-string leaf in a nested patch, in depth-first order.
+    The walk uses an explicit stack, so deeply nested generated patches cannot hit the recursion limit.
+    """
+    unresolved: list[str] = []
+    # Children are pushed in reverse so paths come out in the same order as a recursive walk.
+    stack: list[tuple[str, Any]] = [(prefix, payload)]
+    while stack:
+        name, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(
+                (f"{name}.{key}" if name else str(key), value) for key, value in reversed(list(node.items()))
+            )
+        elif name and (node is None or (isinstance(node, str) and not node.strip())):
+            unresolved.append(name)
+    return unresolved
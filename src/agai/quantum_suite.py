@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import math
 import re
 from collections import Counter
@@ -62,25 +63,19 @@ def _tokenize(text: str) -> list[str]:
     return [token.lower() for token in TOKEN_RE.findall(text)]
 
 
-def _concept_coverage(expected_tokens: set[str], observed_tokens: set[str]) -> float:
-    matched = 0
-    total = 0
-    for concept_tokens in CONCEPT_LEXICON.values():
-        if not (concept_tokens & expected_tokens):
-            continue
-        total += 1
-        if concept_tokens & observed_tokens:
-            matched += 1
-    if total == 0:
-        return 0.0
-    return matched / total
+def _concept_hits(tokens: frozenset[str] | set[str]) -> frozenset[int]:
+    return frozenset(
+        index
+        for index, concept_tokens in enumerate(CONCEPT_LEXICON.values())
+        if not concept_tokens.isdisjoint(tokens)
+    )
 
 
-def _concept_vector(tokens: set[str]) -> list[float]:
-    vector: list[float] = []
-    for concept_tokens in CONCEPT_LEXICON.values():
-        vector.append(1.0 if concept_tokens & tokens else 0.0)
-    return vector
+@functools.lru_cache(maxsize=256)
+def _expected_profile(expected_hint: str) -> tuple[frozenset[str], frozenset[int]]:
+    # Each case's expected hint is scored against many answers, so its tokens and concepts are derived once.
+    tokens = frozenset(_tokenize(expected_hint))
+    return tokens, _concept_hits(tokens)
 
 
 def _jaccard(left: set[str], right: set[str]) -> float:
@@ -109,15 +104,6 @@ def _cross_split_overlap(left_cases: list[EvalCase], right_cases: list[EvalCase]
     }
 
 
-def _cosine_similarity(left: list[float], right: list[float]) -> float:
-    dot = sum(a * b for a, b in zip(left, right))
-    left_norm = math.sqrt(sum(v * v for v in left))
-    right_norm = math.sqrt(sum(v * v for v in right))
-    if left_norm <= 0.0 or right_norm <= 0.0:
-        return 0.0
-    return dot / (left_norm * right_norm)
-
-
 def _keyword_stuffing_penalty(expected_tokens: set[str], observed_tokens: list[str]) -> float:
     if not observed_tokens:
         return 0.35
@@ -250,27 +236,37 @@ def adversarial_quantum_suite() -> list[EvalCase]:
 
 
 def suite_leakage_report() -> dict[str, dict[str, float]]:
+    return {pair: dict(overlap) for pair, overlap in _suite_leakage_pairs()}
+
+
+@functools.lru_cache(maxsize=1)
+def _suite_leakage_pairs() -> tuple[tuple[str, dict[str, float]], ...]:
+    # The suites are fixed literals, so their pairwise overlap only needs computing once per process.
     public = default_quantum_suite()
     holdout = holdout_quantum_suite()
     adversarial = adversarial_quantum_suite()
-    return {
-        "public_vs_holdout": _cross_split_overlap(public, holdout),
-        "public_vs_adversarial": _cross_split_overlap(public, adversarial),
-        "holdout_vs_adversarial": _cross_split_overlap(holdout, adversarial),
-    }
+    return (
+        ("public_vs_holdout", _cross_split_overlap(public, holdout)),
+        ("public_vs_adversarial", _cross_split_overlap(public, adversarial)),
+        ("holdout_vs_adversarial", _cross_split_overlap(holdout, adversarial)),
+    )
 
 
 def score_quantum_answer(expected_hint: str, answer: str) -> float:
-    expected_tokens = set(_tokenize(expected_hint))
+    expected_tokens, expected_concepts = _expected_profile(expected_hint)
     normalized_answer = _strip_evidence_keywords(answer)
     observed_list = _tokenize(normalized_answer)
     observed_tokens = set(observed_list)
+    observed_concepts = _concept_hits(observed_tokens)
 
     lexical_coverage = len(expected_tokens & observed_tokens) / (len(expected_tokens) or 1)
-    semantic_coverage = _concept_coverage(expected_tokens=expected_tokens, observed_tokens=observed_tokens)
-    embedding_similarity = _cosine_similarity(
-        _concept_vector(expected_tokens),
-        _concept_vector(observed_tokens),
+    # Concept vectors are 0/1 indicators, so coverage and cosine similarity reduce to set-size arithmetic.
+    shared_concepts = len(expected_concepts & observed_concepts)
+    semantic_coverage = shared_concepts / len(expected_concepts) if expected_concepts else 0.0
+    embedding_similarity = (
+        shared_concepts / (math.sqrt(len(expected_concepts)) * math.sqrt(len(observed_concepts)))
+        if expected_concepts and observed_concepts
+        else 0.0
     )
 
     signals = _rubric_signals(tokens=observed_tokens, answer=normalized_answer)
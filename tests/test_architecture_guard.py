@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import json
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -16,6 +19,20 @@ class TestArchitectureGuard(unittest.TestCase):
         result = guard.validate()
         self.assertTrue(result["ok"], msg=str(result["errors"]))
 
+    def test_fail_fast_stops_at_first_error(self) -> None:
+        temp_dir = Path(tempfile.mkdtemp(prefix="agai-arch-guard-"))
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        reference_path = temp_dir / "architecture_reference.json"
+        reference_path.write_text(
+            json.dumps({"interfaces": {"NoSuchTypeA": ["x"], "NoSuchTypeB": ["y"]}}),
+            encoding="utf-8",
+        )
+        guard = ArchitectureGuard(reference_path=str(reference_path))
+        self.assertEqual(len(guard.validate()["errors"]), 2)
+        result = guard.validate(fail_fast=True)
+        self.assertFalse(result["ok"])
+        self.assertEqual(result["errors"], ["Missing type: NoSuchTypeA"])
+
 
 if __name__ == "__main__":
     unittest.main()
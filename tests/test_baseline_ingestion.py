@@ -162,6 +162,20 @@ class TestExternalBaselineIngestionService(unittest.TestCase):
         self.assertIn("source must not be placeholder or unknown", result["errors"])
         self.assertIn("source_date must be ISO-8601 date (YYYY-MM-DD)", result["errors"])
 
+    def test_parse_file_does_not_touch_registry(self) -> None:
+        self.input_path.write_text("{not json", encoding="utf-8")
+        invalid = self.service.parse_file(str(self.input_path))
+        self.assertEqual(invalid["status"], "error")
+        self.assertIn("invalid json", invalid["reason"])
+        self.assertEqual(self.service.apply_parsed(invalid), invalid)
+
+        self.input_path.write_text(json.dumps({"baseline_id": "external-parsed"}), encoding="utf-8")
+        parsed = self.service.parse_file(str(self.input_path))
+        self.assertEqual(parsed["status"], "parsed")
+        self.assertEqual(parsed["payload"]["baseline_id"], "external-parsed")
+        self.assertTrue(str(parsed["input_hash"]).startswith("sha256:"))
+        self.assertFalse(self.registry_path.exists())
+
 
 if __name__ == "__main__":
     unittest.main()
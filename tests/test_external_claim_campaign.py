@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 import unittest
+from unittest import mock
 
 from agai.external_claim_campaign import ExternalClaimSandboxCampaignRunner
 
@@ -202,6 +205,22 @@ class TestExternalClaimSandboxCampaignRunner(unittest.TestCase):
         self.assertEqual(step["delta"]["total_claim_distance_reduction"], 1)
         self.assertEqual(payload["ingest_stage"]["results"][0]["status"], "ok")
 
+    def test_distance_snapshot_is_not_cached_inside_the_racy_window(self) -> None:
+        self.source_registry.write_text(json.dumps({"baselines": []}), encoding="utf-8")
+        snapshot = {"remaining_distance": 1.0}
+        with mock.patch.object(self.runner, "_compute_distance_snapshot", return_value=snapshot) as compute:
+            for _ in range(2):
+                self.runner._distance_snapshot(
+                    eval_report=self.eval_report, registry_path=str(self.source_registry), max_metric_delta=0.02
+                )
+            self.assertEqual(compute.call_count, 2)
+            os.utime(self.source_registry, (time.time() - 60, time.time() - 60))
+            for _ in range(2):
+                self.runner._distance_snapshot(
+                    eval_report=self.eval_report, registry_path=str(self.source_registry), max_metric_delta=0.02
+                )
+            self.assertEqual(compute.call_count, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -175,6 +175,64 @@ class TestExternalClaimCampaignAutofillService(unittest.TestCase):
         self.assertEqual(ingest_payload["scoring_protocol"], "src/agai/quantum_suite.py:263")
         self.assertEqual(ingest_payload["evidence"]["replication_status"], "replicated-internal-harness")
 
+    def test_autofill_inline_ingest_payload_rejects_boolean_metrics(self) -> None:
+        evidence_map = {
+            "baselines": {
+                "external-a": {
+                    "source": "arxiv:2501.12948",
+                    "source_date": "2026-02-17",
+                    "evidence": {
+                        "citation": "arxiv:2501.12948",
+                        "retrieval_date": "2026-02-17",
+                        "verification_method": "manual extraction",
+                    },
+                    "metrics": {
+                        "quality": True,
+                        "aggregate_delta": "0.48",
+                    },
+                    "generate_ingest_payload": True,
+                }
+            },
+        }
+        payload = self.service.build(
+            scaffold_payload=self.scaffold_payload,
+            evidence_map=evidence_map,
+            eval_report=self.eval_report,
+            output_dir=str(self.temp_dir / "autofill"),
+        )
+        self.assertEqual(payload["summary"]["generated_ingest_payloads"], 0)
+        unresolved = payload["unresolved_baselines"][0]["unresolved_fields"]
+        self.assertEqual(unresolved, ["metrics.quality (non-numeric)"])
+
+    def test_autofill_rows_sharing_a_scaffold_patch_fill_independently(self) -> None:
+        scaffold_payload = {
+            "status": "ok",
+            "generated_files": [
+                {"baseline_id": "external-a", "patch_overrides_path": str(self.patch_template)},
+                {"baseline_id": "external-b", "patch_overrides_path": str(self.patch_template)},
+            ],
+        }
+        evidence_map = {
+            "baselines": {
+                "external-a": {
+                    "evidence": {"citation": "arxiv:2501.12948"},
+                    "metrics": {"quality": 0.90},
+                },
+                "external-b": {},
+            }
+        }
+        payload = self.service.build(
+            scaffold_payload=scaffold_payload,
+            evidence_map=evidence_map,
+            eval_report=self.eval_report,
+            output_dir=str(self.temp_dir / "autofill"),
+        )
+        filled = {row["baseline_id"]: row["unresolved_fields"] for row in payload["filled_files"]}
+        self.assertNotIn("evidence.citation", filled["external-a"])
+        self.assertNotIn("metrics.quality", filled["external-a"])
+        self.assertIn("evidence.citation", filled["external-b"])
+        self.assertIn("metrics.quality", filled["external-b"])
+
 
 class TestRuntimeExternalClaimCampaignAutofill(unittest.TestCase):
     def setUp(self) -> None:
@@ -9,6 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 import unittest
+from unittest import mock
 
 from agai.external_claim_campaign_draft import ExternalClaimCampaignDraftService
 from agai.runtime import AgenticRuntime
@@ -103,6 +104,34 @@ class TestExternalClaimCampaignDraftService(unittest.TestCase):
         self.assertEqual(payload["summary"]["unresolved_dependencies"], 1)
         self.assertIn("unresolved empty/null fields", payload["unresolved_dependencies"][0]["reason"])
 
+    def test_build_loads_a_patch_shared_by_several_rows_once(self) -> None:
+        patch_path = self.temp_dir / "patch_shared.json"
+        patch_path.write_text(
+            json.dumps(
+                {"baseline_id": "external-c", "source": "arxiv:2501.12948", "source_date": "2026-02-17"},
+                ensure_ascii=True,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        claim_plan = {
+            "row_plans": [
+                {"baseline_id": baseline_id, "actions": [{"action_type": "refresh_evidence_payload"}]}
+                for baseline_id in ("external-a", "external-b")
+            ]
+        }
+        load_json_object = self.service._load_json_object
+        with mock.patch.object(self.service, "_load_json_object", side_effect=load_json_object) as loader:
+            payload = self.service.build(
+                claim_plan=claim_plan,
+                patch_overrides_map={"external-a": str(patch_path), "external-b": str(patch_path)},
+                ingest_payload_paths=[str(patch_path)],
+            )
+        self.assertEqual(loader.call_count, 1)
+        self.assertEqual(payload["status"], "ok")
+        self.assertEqual(payload["summary"]["baseline_runs_ready"], 2)
+        self.assertEqual(payload["summary"]["ingest_payloads_ready"], 1)
+
 
 class TestRuntimeExternalClaimCampaignDraft(unittest.TestCase):
     def setUp(self) -> None:
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import hashlib
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import unittest
+
+from agai.file_hashing import sha256_file
+
+
+class TestSha256File(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="agai-file-hashing-"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_matches_in_memory_digest_across_chunk_boundaries(self) -> None:
+        path = self.temp_dir / "registry.json"
+        data = b"0123456789abcdef" * ((1 << 20) // 16 + 3)
+        path.write_bytes(data)
+        self.assertEqual(sha256_file(path), hashlib.sha256(data).hexdigest())
+        self.assertEqual(sha256_file(str(path)), hashlib.sha256(data).hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
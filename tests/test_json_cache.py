@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import unittest
+
+from agai.json_cache import clear_json_cache, load_json_cached, replace_file_if_changed
+
+
+class TestJsonCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="agai-json-cache-"))
+        self.path = self.temp_dir / "payload.json"
+        clear_json_cache()
+
+    def tearDown(self) -> None:
+        clear_json_cache()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_aged(self, payload: object, mtime: float) -> None:
+        self.path.write_text(json.dumps(payload), encoding="utf-8")
+        os.utime(self.path, (mtime, mtime))
+
+    def test_reuses_parse_while_file_unchanged(self) -> None:
+        self._write_aged({"a": 1}, time.time() - 60)
+        first = load_json_cached(self.path)
+        second = load_json_cached(str(self.path))
+        self.assertEqual(first, {"a": 1})
+        self.assertIs(first, second)
+
+    def test_reparses_when_file_changes(self) -> None:
+        mtime = time.time() - 60
+        self._write_aged({"a": 1}, mtime)
+        self.assertEqual(load_json_cached(self.path), {"a": 1})
+        self._write_aged({"a": 22}, mtime)
+        self.assertEqual(load_json_cached(self.path), {"a": 22})
+
+    def test_recently_modified_file_is_always_reread(self) -> None:
+        self.path.write_text(json.dumps({"a": 1}), encoding="utf-8")
+        first = load_json_cached(self.path)
+        self.assertIsNot(first, load_json_cached(self.path))
+
+    def test_missing_file_raises(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            load_json_cached(self.temp_dir / "missing.json")
+
+    def test_replace_file_if_changed_skips_identical_content(self) -> None:
+        target = self.temp_dir / "nested" / "out.json"
+        self.assertTrue(replace_file_if_changed(target, b'{"a": 1}'))
+        os.utime(target, (1_000_000, 1_000_000))
+        self.assertFalse(replace_file_if_changed(target, b'{"a": 1}'))
+        self.assertEqual(target.stat().st_mtime, 1_000_000)
+        self.assertTrue(replace_file_if_changed(target, b'{"a": 2}'))
+        self.assertEqual(target.read_bytes(), b'{"a": 2}')
+        self.assertEqual(sorted(path.name for path in target.parent.iterdir()), ["out.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
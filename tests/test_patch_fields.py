@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import unittest
+
+from agai.patch_fields import unresolved_fields
+
+
+class TestUnresolvedFields(unittest.TestCase):
+    def test_reports_blank_and_null_leaves_in_depth_first_order(self) -> None:
+        payload = {
+            "source": "",
+            "evidence": {"citation": None, "artifact_hash": "sha256:x", "retrieval_date": "  "},
+            "metrics": {"quality": 0.9},
+            "notes": "ok",
+        }
+        self.assertEqual(
+            unresolved_fields(payload),
+            ["source", "evidence.citation", "evidence.retrieval_date"],
+        )
+
+    def test_prefix_is_prepended_and_bare_scalars_are_not_reported(self) -> None:
+        self.assertEqual(unresolved_fields({"a": None}, prefix="patch"), ["patch.a"])
+        self.assertEqual(unresolved_fields(None), [])
+        self.assertEqual(unresolved_fields(""), [])
+
+    def test_deeply_nested_payload_does_not_hit_the_recursion_limit(self) -> None:
+        payload: dict[str, object] = {"leaf": None}
+        for _ in range(sys.getrecursionlimit() + 100):
+            payload = {"n": payload}
+        self.assertEqual(len(unresolved_fields(payload)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()